@@ -5,22 +5,25 @@ Provides a rich CLI experience with progress bars, formatted output,
 and comprehensive options for extraction and export.
 """
 
+import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from claude_extractor import __version__
-from claude_extractor.config import Config, load_config
-from claude_extractor.extractors.hybrid_extractor import HybridExtractor
-from claude_extractor.exporters.json_exporter import JSONExporter
-from claude_extractor.exporters.markdown_exporter import MarkdownExporter
+from claude_extractor.config import DEFAULT_MAX_CONCURRENT, Config, load_config
 from claude_extractor.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from claude_extractor.models import Conversation
+
+# The extractor (Playwright), exporters, and rich progress/table widgets
+# are imported inside the commands that use them, so --help and
+# --version don't pay for the whole extraction stack.
+
 console = Console()
 logger = setup_logger()
 
@@ -114,6 +117,9 @@ def extract(
     Example:
         claude-extract https://claude.ai/chat/abc123 -o ./exports
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from claude_extractor.extractors.hybrid_extractor import HybridExtractor
+    
     config: Config = ctx.obj["config"]
     verbose: bool = ctx.obj["verbose"]
     
@@ -129,7 +135,7 @@ def extract(
     else:
         output_path = config.output_dir
     
-    output_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path)
     
     # Check authentication
     if not auth_cookie:
@@ -205,9 +211,15 @@ def extract(
 @click.option(
     "--max-concurrent",
     type=int,
-    default=3,
+    default=DEFAULT_MAX_CONCURRENT,
     help="Maximum concurrent extractions"
 )
+@click.option(
+    "--timeout",
+    type=int,
+    default=60,
+    help="Request timeout in seconds"
+)
 @click.pass_context
 def batch(
     ctx: click.Context,
@@ -216,6 +228,7 @@ def batch(
     format: str,
     auth_cookie: Optional[str],
     max_concurrent: int,
+    timeout: int,
 ) -> None:
     """
     Extract multiple conversations from a file.
@@ -227,13 +240,15 @@ def batch(
         https://claude.ai/chat/def456
         https://claude.ai/chat/ghi789
     """
-    # Read URLs from file
-    urls = []
-    with open(batch_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                urls.append(line)
+    from rich.progress import Progress
+    from claude_extractor.extractors.hybrid_extractor import HybridExtractor
+    
+    # Read URLs from file, skipping blank lines and comments
+    urls = [
+        line
+        for line in map(str.strip, Path(batch_file).read_text().splitlines())
+        if line and not line.startswith("#")
+    ]
     
     if not urls:
         console.print("[red]No valid URLs found in batch file[/red]")
@@ -242,37 +257,47 @@ def batch(
     console.print(f"Found {len(urls)} conversations to extract")
     
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path)
     
-    # Process each URL
+    # Extract concurrently over one shared browser; extraction is
+    # network-bound, so up to max_concurrent pages load at once
     successful = 0
     failed = 0
     
-    with Progress(console=console) as progress:
+    extractor = HybridExtractor(auth_cookie=auth_cookie, timeout=timeout)
+    
+    # Each extraction takes seconds; a 2 Hz repaint is plenty
+    with Progress(console=console, refresh_per_second=2) as progress:
         task = progress.add_task("Processing conversations...", total=len(urls))
         
-        for url in urls:
-            try:
-                # Extract conversation ID for folder name
-                conv_id = url.split("/")[-1]
-                conv_output = output_path / conv_id
-                conv_output.mkdir(exist_ok=True)
-                
-                # Extract
-                extractor = HybridExtractor(auth_cookie=auth_cookie)
-                conversation = extractor.extract(url)
-                
-                # Export
-                _export_conversation(conversation, conv_output, format, True, False)
-                
-                successful += 1
-                progress.console.print(f"[green]✓[/green] {conv_id}")
-                
-            except Exception as e:
+        async def _export_one(url: str, result: Union["Conversation", Exception]) -> None:
+            nonlocal successful, failed
+            # Output folder per URL, named after the conversation ID
+            conv_output = output_path / url.rsplit("/", 1)[-1]
+            if isinstance(result, Exception):
                 failed += 1
-                progress.console.print(f"[red]✗[/red] {url}: {e}")
+                progress.console.print(f"[red]✗[/red] {url}: {result}")
+            else:
+                try:
+                    _ensure_dir(conv_output)
+                    await asyncio.to_thread(
+                        _export_conversation, result, conv_output, format, True, False
+                    )
+                    successful += 1
+                    progress.console.print(f"[green]✓[/green] {conv_output.name}")
+                except Exception as e:
+                    failed += 1
+                    progress.console.print(f"[red]✗[/red] {url}: {e}")
             
             progress.advance(task)
+        
+        async def _extract_all() -> None:
+            async with extractor:
+                await extractor.extract_many(
+                    urls, max_concurrent=max_concurrent, on_result=_export_one
+                )
+        
+        asyncio.run(_extract_all())
     
     console.print(f"\n[bold]Batch extraction complete![/bold]")
     console.print(f"Successful: {successful}")
@@ -291,9 +316,14 @@ def analyze(ctx: click.Context, conversation_file: str) -> None:
     import json
     from claude_extractor.analyzers.conversation_analyzer import ConversationAnalyzer
     
-    # Load conversation
-    with open(conversation_file, "r") as f:
-        data = json.load(f)
+    # Load conversation (orjson parses the raw bytes directly when available)
+    raw = Path(conversation_file).read_bytes()
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional speedup
+        data = json.loads(raw)
+    else:
+        data = orjson.loads(raw)
     
     # Analyze
     analyzer = ConversationAnalyzer()
@@ -303,8 +333,17 @@ def analyze(ctx: click.Context, conversation_file: str) -> None:
     _display_analysis(analysis)
 
 
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) unless it already exists."""
+    # A stat on an existing directory is cheaper than a mkdir that fails
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
 def _display_conversation_summary(conversation) -> None:
     """Display a summary of the extracted conversation."""
+    from rich.table import Table
+    
     table = Table(title="Conversation Summary", show_header=False)
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
@@ -333,6 +372,8 @@ def _export_conversation(
     verbose: bool,
 ) -> None:
     """Export conversation to specified format(s)."""
+    from claude_extractor.exporters.json_exporter import JSONExporter
+    from claude_extractor.exporters.markdown_exporter import MarkdownExporter
     
     if format in ["json", "both"]:
         json_exporter = JSONExporter(pretty=True)
@@ -5,12 +5,84 @@ Handles loading configuration from files, environment variables,
 and provides sensible defaults.
 """
 
+import json
+import os
+import struct
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeDumper as _YAMLDumper, CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YAMLDumper, SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
+
+# Pages extracted at once by batch runs; shared by PerformanceConfig, the
+# batch CLI and HybridExtractor
+DEFAULT_MAX_CONCURRENT = 3
+
+# In-process memo for load_config: resolved path -> (mtime_ns, Config)
+_CONFIG_CACHE: Dict[str, Tuple[int, "Config"]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Parsed-config cache header: format tag, source st_mtime_ns and st_size
+_CACHE_HEADER = struct.Struct("<4sqq")
+_CACHE_FORMAT = b"CFG2"
+
+
+def _cache_path(path: Path) -> Path:
+    """Get the parsed-config cache path for a YAML config file."""
+    return path.with_name(path.name + ".cache")
+
+
+def _read_cached_data(path: Path, stat: os.stat_result) -> Optional[Any]:
+    """Return cached config data for path, or None if missing or stale."""
+    try:
+        with open(_cache_path(path), "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    
+    if len(raw) < _CACHE_HEADER.size:
+        return None
+    header = (_CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+    if _CACHE_HEADER.unpack_from(raw) != header:
+        return None
+    
+    try:
+        return json.loads(raw[_CACHE_HEADER.size:])
+    except ValueError:
+        return None
+
+
+def _write_cached_data(path: Path, stat: os.stat_result, data: Any) -> None:
+    """Atomically write config data to the cache; failures are ignored."""
+    try:
+        # Paths are the only non-JSON values in a validated config dict
+        payload = json.dumps(data, default=str).encode("utf-8")
+    except (TypeError, ValueError):
+        return
+    
+    cache = _cache_path(path)
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=f".{cache.name}.")
+        with open(fd, "wb") as f:
+            f.write(_CACHE_HEADER.pack(_CACHE_FORMAT, stat.st_mtime_ns, stat.st_size))
+            f.write(payload)
+        os.replace(tmp, cache)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
 
 class MarkdownConfig(BaseModel):
     """Markdown export configuration."""
@@ -36,7 +108,7 @@ class AuthConfig(BaseModel):
 class PerformanceConfig(BaseModel):
     """Performance and resource configuration."""
     timeout: int = Field(60, description="Request timeout in seconds")
-    max_concurrent: int = Field(3, description="Max concurrent extractions")
+    max_concurrent: int = Field(DEFAULT_MAX_CONCURRENT, description="Max concurrent extractions")
     retry_attempts: int = Field(3, description="Number of retry attempts")
     rate_limit_delay: float = Field(1.0, description="Delay between requests (seconds)")
 
@@ -74,20 +146,60 @@ class Config(BaseModel):
     def save(self, path: Path) -> None:
         """Save configuration to YAML file."""
         path.parent.mkdir(parents=True, exist_ok=True)
+        # Round-trip through JSON so Path values are written as plain strings
+        data = json.loads(json.dumps(self.to_dict(), default=str))
         with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data, f, Dumper=_YAMLDumper, default_flow_style=False, sort_keys=False
+            )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
         """Load configuration from dictionary."""
         return cls(**data)
 
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Config":
+        """
+        Build configuration from already-validated data, skipping validation.
+        
+        model_construct() neither builds nested models nor coerces types,
+        so the sub-configurations and Path fields are rebuilt here
+        explicitly.
+        """
+        values = dict(data)
+        for name in ("output_dir", "log_file"):
+            if values.get(name) is not None:
+                values[name] = Path(values[name])
+        for name, model in (
+            ("auth", AuthConfig),
+            ("performance", PerformanceConfig),
+            ("markdown", MarkdownConfig),
+            ("json", JSONConfig),
+        ):
+            if name in values:
+                values[name] = model.model_construct(**values[name])
+        return cls.model_construct(**values)
+
     @classmethod
     def from_file(cls, path: Path) -> "Config":
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+        
+        The validated config is cached as JSON beside the file
+        (config.yaml.cache), keyed on the file's mtime and size. Repeated
+        CLI runs skip YAML parsing and validation until the file changes.
+        """
+        stat = os.stat(path)
+        data = _read_cached_data(path, stat)
+        if data is not None:
+            return cls.from_trusted_dict(data)
+        
         with open(path, "r") as f:
-            data = yaml.safe_load(f)
-        return cls.from_dict(data)
+            data = yaml.load(f, Loader=_YAMLLoader)
+        config = cls.from_dict(data)
+        _write_cached_data(path, stat, config.to_dict())
+        return config
 
 
 def get_config_path() -> Path:
@@ -99,6 +211,10 @@ def load_config(path: Optional[Path] = None) -> Config:
     """
     Load configuration from file or create default.
     
+    Loaded configs are memoized per process until the file's mtime
+    changes; the same Config instance is returned for repeat calls.
+    Use clear_config_cache() to force a reload.
+    
     Args:
         path: Optional path to config file. If None, uses default location.
     
@@ -110,7 +226,15 @@ def load_config(path: Optional[Path] = None) -> Config:
     
     if path.exists():
         try:
-            return Config.from_file(path)
+            key = str(path.resolve())
+            mtime_ns = path.stat().st_mtime_ns
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(key)
+                if cached is not None and cached[0] == mtime_ns:
+                    return cached[1]
+                config = Config.from_file(path)
+                _CONFIG_CACHE[key] = (mtime_ns, config)
+            return config
         except Exception as e:
             print(f"Warning: Could not load config from {path}: {e}")
             print("Using default configuration")
@@ -129,6 +253,12 @@ def load_config(path: Optional[Path] = None) -> Config:
         return config
 
 
+def clear_config_cache() -> None:
+    """Clear the in-process load_config memo."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
 def ensure_config_exists() -> Config:
     """Ensure configuration exists, create if needed."""
     return load_config()
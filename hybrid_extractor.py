@@ -10,14 +10,14 @@ This extractor tries multiple methods to extract conversation data:
 import asyncio
 import json
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
+from claude_extractor.config import DEFAULT_MAX_CONCURRENT
 from claude_extractor.models import (
     Artifact,
     ArtifactType,
@@ -31,6 +31,95 @@ from claude_extractor.models import (
     ToolCallStatus,
 )
 
+if TYPE_CHECKING:
+    # Playwright is imported when a browser is first launched, so users of
+    # the models/exporters don't pay for it
+    from playwright.async_api import (
+        Browser,
+        BrowserContext,
+        Playwright,
+        Response,
+        Route,
+    )
+
+
+# Conversation ID: the path segment after the first /chat/ segment. The
+# prefix can't cross '?' or '#', so query strings and fragments never match.
+_CHAT_ID_RE = re.compile(r"[^?#]*?/chat/([^/?#]+)")
+
+# Artifact MIME types used by the conversation API's "artifacts" tool
+_ARTIFACT_MIME_TYPES = {
+    "application/vnd.ant.code": "code",
+    "text/markdown": "markdown",
+    "text/html": "html",
+    "application/vnd.ant.react": "react",
+    "application/vnd.ant.mermaid": "mermaid",
+    "image/svg+xml": "svg",
+    "text/plain": "text",
+}
+
+# DOM fallback scraper, built once. Messages and artifacts are collected in a
+# single document-order walk over one combined selector. Role and timestamp
+# are read from the message element's own data attributes, falling back to
+# a descendant for markup that keeps them on a child.
+_EXTRACTION_JS = """
+() => {
+    const data = {
+        title: document.title || 'Untitled Conversation',
+        messages: [],
+        artifacts: [],
+        metadata: {},
+    };
+    
+    const attr = (el, name) => {
+        if (el.hasAttribute(name)) return el.getAttribute(name);
+        const child = el.querySelector(`[${name}]`);
+        return child ? child.getAttribute(name) : null;
+    };
+    
+    const elements = document.querySelectorAll(
+        '[data-testid="chat-message"],[data-artifact-id]'
+    );
+    for (const el of elements) {
+        if (el.dataset.testid === 'chat-message') {
+            const contentEl = el.querySelector('.prose');
+            data.messages.push({
+                id: `msg_${data.messages.length}`,
+                role: attr(el, 'data-role') || 'unknown',
+                content: contentEl ? contentEl.innerText : '',
+                timestamp: attr(el, 'data-timestamp') || new Date().toISOString(),
+            });
+        }
+        // An element may be both a message and an artifact
+        if (el.dataset.artifactId !== undefined) {
+            data.artifacts.push({
+                id: el.dataset.artifactId,
+                type: el.dataset.artifactType || 'code',
+                content: el.querySelector('code, pre')?.innerText || '',
+            });
+        }
+    }
+    
+    return data;
+}
+"""
+
+# Resolves once messages have rendered and their count has stopped growing
+# for `quietMs`, so the DOM fallback doesn't scrape a half-rendered thread.
+# State lives on window because the function is re-run on every poll.
+_MESSAGES_SETTLED_JS = """
+(quietMs) => {
+    const n = document.querySelectorAll('[data-testid="chat-message"]').length;
+    const now = Date.now();
+    const last = window.__archaeologistMessageCount;
+    if (!last || last.n !== n) {
+        window.__archaeologistMessageCount = { n: n, since: now };
+        return false;
+    }
+    return n > 0 && now - last.since >= quietMs;
+}
+"""
+
 
 class ExtractionError(Exception):
     """Base exception for extraction errors."""
@@ -48,14 +137,48 @@ class HybridExtractor:
     
     This extractor intelligently falls back through multiple strategies
     to ensure reliable data extraction.
+    
+    Used as an async context manager, one browser is launched on entry and
+    shared by every extraction until exit (a new page per conversation).
+    Outside a context, each extraction launches and closes its own browser.
+    
+    Example:
+        async with HybridExtractor(auth_cookie=cookie) as extractor:
+            results = await extractor.extract_many(urls, max_concurrent=3)
     """
     
+    # Chromium flags that trim background work irrelevant to scraping
+    BROWSER_ARGS = (
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-ipc-flooding-protection",
+        "--disk-cache-size=33554432",
+    )
+    
+    # Images, media, fonts and manifests, which the DOM text extraction
+    # never reads. Stylesheets are kept: innerText depends on CSS
+    # visibility. Matched by URL so only these requests are intercepted;
+    # routing every request would disable the browser's HTTP cache.
+    BLOCKED_RESOURCE_URLS = re.compile(
+        r"\.(?:png|jpe?g|gif|webp|avif|ico|svg|mp4|webm|mp3|wav|ogg"
+        r"|woff2?|ttf|otf|eot|webmanifest)(?:[?#]|$)",
+        re.IGNORECASE,
+    )
+    
+    # How long the message count must hold steady before the DOM fallback
+    # treats the conversation as fully rendered
+    MESSAGES_QUIET_MS = 500
+    
     def __init__(
         self,
         auth_cookie: Optional[str] = None,
         timeout: int = 60,
         include_thinking: bool = True,
         verbose: bool = False,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ):
         """
         Initialize hybrid extractor.
@@ -65,19 +188,111 @@ class HybridExtractor:
             timeout: Request timeout in seconds
             include_thinking: Include Claude's thinking process
             verbose: Enable verbose logging
+            max_concurrent: Default page concurrency for extract_many
         """
         self.auth_cookie = auth_cookie
         self.timeout = timeout
         self.include_thinking = include_thinking
         self.verbose = verbose
+        self.max_concurrent = max_concurrent
+        
+        # Shared browser, set while inside `async with`
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
         
         if verbose:
             logger.setLevel("DEBUG")
     
+    async def __aenter__(self) -> "HybridExtractor":
+        """Launch a browser shared by all extractions until exit."""
+        self._playwright, self._browser, self._context = await self._launch_browser()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the shared browser."""
+        playwright, browser = self._playwright, self._browser
+        self._playwright = self._browser = self._context = None
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+    
     def extract(self, url: str) -> Conversation:
         """
         Extract conversation from URL.
         
+        Synchronous wrapper around extract_async; runs its own event loop,
+        so it must not be called from inside a running loop.
+        
+        Args:
+            url: Claude conversation URL
+        
+        Returns:
+            Extracted conversation data
+        
+        Raises:
+            ExtractionError: If extraction fails with all strategies
+        """
+        return asyncio.run(self.extract_async(url))
+    
+    async def extract_many(
+        self,
+        urls: List[str],
+        max_concurrent: Optional[int] = None,
+        on_result: Optional[
+            Callable[[str, Union[Conversation, Exception]], Awaitable[None]]
+        ] = None,
+    ) -> List[Union[Conversation, BaseException]]:
+        """
+        Extract several conversations concurrently over one browser.
+        
+        Opens the shared browser for the duration of the call unless the
+        extractor is already inside `async with`. Each extraction runs in
+        its own page of the shared context, so page loads and API waits
+        overlap.
+        
+        Args:
+            urls: Claude conversation URLs
+            max_concurrent: Maximum extractions in flight at once
+                (defaults to the extractor's max_concurrent)
+            on_result: Awaited with each URL and its Conversation (or the
+                exception extraction raised) as soon as that extraction
+                finishes, outside the concurrency limit
+        
+        Returns:
+            One entry per URL, in order: the Conversation, or the exception
+            that extraction raised
+        """
+        if max_concurrent is None:
+            max_concurrent = self.max_concurrent
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        
+        async def _extract_one(url: str) -> Conversation:
+            try:
+                async with semaphore:
+                    conversation = await self.extract_async(url)
+            except Exception as e:
+                if on_result is not None:
+                    await on_result(url, e)
+                raise
+            if on_result is not None:
+                await on_result(url, conversation)
+            return conversation
+        
+        if self._context is not None:
+            return await asyncio.gather(
+                *(_extract_one(url) for url in urls), return_exceptions=True
+            )
+        async with self:
+            return await asyncio.gather(
+                *(_extract_one(url) for url in urls), return_exceptions=True
+            )
+    
+    async def extract_async(self, url: str) -> Conversation:
+        """
+        Extract conversation from URL.
+        
         Args:
             url: Claude conversation URL
         
@@ -100,7 +315,7 @@ class HybridExtractor:
         for strategy_name, strategy_func in strategies:
             try:
                 logger.info(f"Trying {strategy_name} extraction...")
-                conversation = asyncio.run(strategy_func(url, conversation_id))
+                conversation = await strategy_func(url, conversation_id)
                 logger.success(f"Successfully extracted via {strategy_name}")
                 return conversation
             except Exception as e:
@@ -138,18 +353,38 @@ class HybridExtractor:
         Extract using browser automation with Playwright.
         
         This method:
-        1. Launches a browser
-        2. Navigates to the conversation
-        3. Injects authentication
-        4. Extracts DOM content
-        5. Parses into structured data
+        1. Uses the shared browser, or launches a one-off browser
+        2. Navigates to the conversation in a new page
+        3. Extracts DOM content
+        4. Parses into structured data
         """
+        if self._context is not None:
+            return await self._extract_in_context(self._context, url, conversation_id)
+        
+        playwright, browser, context = await self._launch_browser()
+        try:
+            return await self._extract_in_context(context, url, conversation_id)
+        finally:
+            await browser.close()
+            await playwright.stop()
+    
+    async def _launch_browser(self) -> Tuple["Playwright", "Browser", "BrowserContext"]:
+        """Start Playwright and open an authenticated browser context."""
+        from playwright.async_api import async_playwright
+        
         logger.debug("Launching browser...")
         
-        async with async_playwright() as p:
-            # Launch browser (headless by default)
-            browser = await p.chromium.launch(headless=not self.verbose)
+        playwright = await async_playwright().start()
+        try:
+            # Launch browser (headless by default). Playwright's headless mode
+            # already runs the lightweight headless shell; don't pass
+            # channel="chromium", which opts into the slower full new-headless
+            browser = await playwright.chromium.launch(
+                headless=not self.verbose,
+                args=list(self.BROWSER_ARGS),
+            )
             context = await browser.new_context()
+            await context.route(self.BLOCKED_RESOURCE_URLS, self._block_resources)
             
             # Set authentication cookie if provided
             if self.auth_cookie:
@@ -159,27 +394,247 @@ class HybridExtractor:
                     "domain": ".claude.ai",
                     "path": "/",
                 }])
+        except BaseException:
+            await playwright.stop()
+            raise
+        
+        return playwright, browser, context
+    
+    async def _block_resources(self, route: "Route") -> None:
+        """Abort requests for resources the extraction doesn't need."""
+        await route.abort()
+    
+    async def _extract_in_context(
+        self,
+        context: "BrowserContext",
+        url: str,
+        conversation_id: str,
+    ) -> Conversation:
+        """
+        Extract a conversation in a new page of the given context.
+        
+        The page's own request for the conversation JSON is captured and
+        used directly when it arrives before the messages render; DOM
+        scraping is the fallback.
+        """
+        page = await context.new_page()
+        api_pattern = re.compile(
+            r"/api/organizations/[^/]+/chat_conversations/"
+            + re.escape(conversation_id)
+            + r"(?:[?#]|$)"
+        )
+        api_response: asyncio.Future = asyncio.get_running_loop().create_future()
+        
+        def _on_response(response: "Response") -> None:
+            if (
+                not api_response.done()
+                and response.ok
+                and api_pattern.search(response.url)
+            ):
+                api_response.set_result(response)
+        
+        page.on("response", _on_response)
+        rendered: Optional[asyncio.Task] = None
+        
+        try:
+            # Navigate to conversation
+            logger.debug(f"Navigating to {url}")
+            # (networkidle can hang on the chat page's long-lived connections)
+            await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout * 1000)
             
-            page = await context.new_page()
+            # Wait for the conversation JSON or for the rendered messages to
+            # settle
+            rendered = asyncio.ensure_future(
+                page.wait_for_function(
+                    _MESSAGES_SETTLED_JS,
+                    arg=self.MESSAGES_QUIET_MS,
+                    polling=250,
+                    timeout=self.timeout * 1000,
+                )
+            )
+            await asyncio.wait(
+                {api_response, rendered}, return_when=asyncio.FIRST_COMPLETED
+            )
             
-            try:
-                # Navigate to conversation
-                logger.debug(f"Navigating to {url}")
-                await page.goto(url, wait_until="networkidle", timeout=self.timeout * 1000)
-                
-                # Wait for conversation to load
-                await page.wait_for_selector('[data-testid="chat-message"]', timeout=30000)
+            conversation_data = None
+            if api_response.done():
+                try:
+                    payload = await api_response.result().json()
+                    conversation_data = self._from_api_payload(payload)
+                    logger.debug("Using captured conversation API response")
+                except Exception as e:
+                    logger.debug(f"Captured API response unusable, using DOM: {e}")
+            
+            if conversation_data is None:
+                await rendered
                 
                 # Extract data
                 conversation_data = await self._extract_from_page(page, conversation_id)
-                
-                # Parse into Conversation object
-                conversation = await self._parse_conversation(conversation_data, url)
-                
-                return conversation
-                
-            finally:
-                await browser.close()
+            
+            # Parse into Conversation object
+            conversation = await self._parse_conversation(
+                conversation_data, url, conversation_id
+            )
+            
+            return conversation
+            
+        finally:
+            if rendered is not None and not rendered.done():
+                rendered.cancel()
+                await asyncio.gather(rendered, return_exceptions=True)
+            await page.close()
+    
+    def _from_api_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a claude.ai conversation API payload to extracted page data.
+        
+        The API is internal and undocumented, so anything unexpected raises
+        and the caller falls back to DOM scraping.
+        
+        Unlike the DOM scrape, the payload carries the whole message tree:
+        messages off the active thread get their own branch IDs, and
+        artifacts and tool calls are read from the content blocks.
+        
+        Args:
+            payload: JSON body of the chat_conversations response
+        
+        Returns:
+            Data in the shape produced by _extract_from_page
+        
+        Raises:
+            ValueError: If the payload has no messages
+        """
+        chat_messages = payload.get("chat_messages")
+        if not chat_messages:
+            raise ValueError("No chat_messages in API response")
+        
+        message_ids = {msg.get("uuid") for msg in chat_messages}
+        parents = {
+            msg.get("uuid"): msg.get("parent_message_uuid") for msg in chat_messages
+        }
+        
+        # The active thread is the path from the current leaf to the root;
+        # it becomes "main" and every sibling subtree gets its own branch
+        leaf = payload.get("current_leaf_message_uuid")
+        if leaf not in message_ids:
+            leaf = chat_messages[-1].get("uuid")
+        branch_of: Dict[Any, str] = {}
+        while leaf in message_ids and leaf not in branch_of:
+            branch_of[leaf] = "main"
+            leaf = parents[leaf]
+        continued = set()
+        branch_count = 0
+        
+        messages = []
+        artifacts: Dict[str, Dict[str, Any]] = {}
+        for msg in chat_messages:
+            parent_id = msg.get("parent_message_uuid")
+            if parent_id not in message_ids:
+                # The root's parent is the all-zero placeholder UUID
+                parent_id = None
+            
+            branch_id = branch_of.get(msg["uuid"])
+            if branch_id is None:
+                # Messages arrive in creation order, so parents come first;
+                # a parent's first off-thread child continues its branch
+                branch_id = branch_of.get(parent_id)
+                if branch_id in (None, "main") or parent_id in continued:
+                    branch_count += 1
+                    branch_id = f"branch_{branch_count}"
+                continued.add(parent_id)
+                branch_of[msg["uuid"]] = branch_id
+            
+            # fromisoformat() before Python 3.11 rejects a trailing Z
+            timestamp = msg["created_at"].replace("Z", "+00:00")
+            text_parts = []
+            tool_calls: List[Dict[str, Any]] = []
+            message_artifacts: List[str] = []
+            for block in msg.get("content") or []:
+                block_type = block.get("type")
+                if block_type == "text":
+                    text_parts.append(block.get("text", ""))
+                elif block_type == "tool_use" and block.get("name") == "artifacts":
+                    artifact_id = self._apply_artifact_command(
+                        artifacts, block.get("input") or {}, msg["uuid"], timestamp
+                    )
+                    if artifact_id is not None:
+                        message_artifacts.append(artifact_id)
+                elif block_type == "tool_use":
+                    tool_calls.append({
+                        "id": block.get("id", f"tool_{len(tool_calls)}"),
+                        "name": block.get("name", "unknown"),
+                        "input": block.get("input") or {},
+                    })
+                elif block_type == "tool_result":
+                    for call in tool_calls:
+                        if call["id"] == block.get("tool_use_id"):
+                            call["result"] = {"content": block.get("content")}
+                            call["is_error"] = bool(block.get("is_error"))
+            
+            messages.append({
+                "id": msg["uuid"],
+                "role": "user" if msg.get("sender") == "human" else "assistant",
+                "content": msg.get("text") or "".join(text_parts),
+                "timestamp": timestamp,
+                "parent_id": parent_id,
+                "branch_id": branch_id,
+                "tool_calls": tool_calls,
+                "artifacts": message_artifacts,
+            })
+        
+        return {
+            "title": payload.get("name") or "Untitled Conversation",
+            "model": payload.get("model") or "unknown",
+            "messages": messages,
+            "artifacts": list(artifacts.values()),
+        }
+    
+    def _apply_artifact_command(
+        self,
+        artifacts: Dict[str, Dict[str, Any]],
+        command: Dict[str, Any],
+        message_id: str,
+        timestamp: str,
+    ) -> Optional[str]:
+        """
+        Apply one "artifacts" tool call from the API payload.
+        
+        "create" adds an artifact; "rewrite" and "update" (a find/replace)
+        change the content of an earlier one and bump its version.
+        
+        Args:
+            artifacts: Artifact data by ID, updated in place
+            command: Input of the tool_use block
+            message_id: Message the tool call belongs to
+            timestamp: Message timestamp
+        
+        Returns:
+            The artifact ID, or None if the command has no ID
+        """
+        artifact_id = command.get("id")
+        if not artifact_id:
+            return None
+        
+        artifact = artifacts.get(artifact_id)
+        if artifact is None or command.get("command", "create") == "create":
+            artifacts[artifact_id] = {
+                "id": artifact_id,
+                "type": _ARTIFACT_MIME_TYPES.get(command.get("type"), "unknown"),
+                "title": command.get("title") or "Untitled",
+                "content": command.get("content", ""),
+                "language": command.get("language"),
+                "created_in_message": message_id,
+                "created_at": timestamp,
+            }
+        elif command.get("command") == "rewrite":
+            artifact["content"] = command.get("content", "")
+            artifact["version"] = artifact.get("version", 1) + 1
+        elif command.get("command") == "update":
+            artifact["content"] = artifact["content"].replace(
+                command.get("old_str", ""), command.get("new_str", ""), 1
+            )
+            artifact["version"] = artifact.get("version", 1) + 1
+        return artifact_id
     
     async def _extract_from_page(
         self,
@@ -193,56 +648,8 @@ class HybridExtractor:
         """
         logger.debug("Extracting data from page DOM...")
         
-        # Inject extraction script
-        extraction_script = """
-        () => {
-            const data = {
-                title: document.title || 'Untitled Conversation',
-                messages: [],
-                artifacts: [],
-                metadata: {},
-            };
-            
-            // Extract messages
-            const messageElements = document.querySelectorAll('[data-testid="chat-message"]');
-            messageElements.forEach((msgEl, index) => {
-                const roleEl = msgEl.querySelector('[data-role]');
-                const role = roleEl ? roleEl.getAttribute('data-role') : 'unknown';
-                
-                const contentEl = msgEl.querySelector('.prose');
-                const content = contentEl ? contentEl.innerText : '';
-                
-                const timestampEl = msgEl.querySelector('[data-timestamp]');
-                const timestamp = timestampEl ? timestampEl.getAttribute('data-timestamp') : new Date().toISOString();
-                
-                data.messages.push({
-                    id: `msg_${index}`,
-                    role: role,
-                    content: content,
-                    timestamp: timestamp,
-                });
-            });
-            
-            // Extract artifacts (simplified)
-            const artifactElements = document.querySelectorAll('[data-artifact-id]');
-            artifactElements.forEach((artEl) => {
-                const artifactId = artEl.getAttribute('data-artifact-id');
-                const artifactType = artEl.getAttribute('data-artifact-type') || 'code';
-                const content = artEl.querySelector('code, pre')?.innerText || '';
-                
-                data.artifacts.push({
-                    id: artifactId,
-                    type: artifactType,
-                    content: content,
-                });
-            });
-            
-            return data;
-        }
-        """
-        
         try:
-            data = await page.evaluate(extraction_script)
+            data = await page.evaluate(_EXTRACTION_JS)
             logger.debug(f"Extracted {len(data.get('messages', []))} messages")
             return data
         except Exception as e:
@@ -253,6 +660,7 @@ class HybridExtractor:
         self,
         data: Dict[str, Any],
         url: str,
+        conversation_id: str,
     ) -> Conversation:
         """
         Parse extracted data into Conversation model.
@@ -260,60 +668,125 @@ class HybridExtractor:
         Args:
             data: Raw extracted data
             url: Conversation URL
+            conversation_id: ID already parsed from the URL
         
         Returns:
             Parsed Conversation object
         """
         logger.debug("Parsing extracted data...")
         
-        conversation_id = self._parse_url(url)
-        
-        # Parse messages
+        # Parse messages, tallying statistics in the same pass
         messages = []
+        tool_calls = []
+        user_messages = assistant_messages = total_tokens = 0
+        user_role = MessageRole.USER.value
+        assistant_role = MessageRole.ASSISTANT.value
+        # Plain dict lookup instead of MessageRole(...) per message
+        role_members = MessageRole._value2member_map_
         for msg_data in data.get("messages", []):
+            # Unknown roles are the common bad input (the DOM path reports
+            # 'unknown'); skip them with a guard rather than an exception
+            role = msg_data.get("role", "user")
+            role_member = role_members.get(role) if isinstance(role, str) else None
+            if role_member is None:
+                logger.warning(f"Failed to parse message: {role!r} is not a valid MessageRole")
+                continue
+            
+            # Every message in a branch repeats its ID; share one string
+            branch_id = msg_data.get("branch_id", "main")
+            if isinstance(branch_id, str):
+                branch_id = sys.intern(branch_id)
+            
             try:
                 message = Message(
                     id=msg_data.get("id", f"msg_{len(messages)}"),
-                    role=MessageRole(msg_data.get("role", "user")),
+                    role=role_member,
                     content=msg_data.get("content", ""),
                     timestamp=datetime.fromisoformat(
                         msg_data.get("timestamp", datetime.now().isoformat())
                     ),
                     parent_id=msg_data.get("parent_id"),
-                    branch_id=msg_data.get("branch_id", "main"),
+                    branch_id=branch_id,
                     tokens=msg_data.get("tokens"),
                     thinking_content=msg_data.get("thinking_content") if self.include_thinking else None,
+                    tool_calls=msg_data.get("tool_calls") or [],
+                    artifacts=msg_data.get("artifacts") or [],
                 )
                 messages.append(message)
             except Exception as e:
                 logger.warning(f"Failed to parse message: {e}")
                 continue
+            
+            if role == user_role:
+                user_messages += 1
+            elif role == assistant_role:
+                assistant_messages += 1
+            total_tokens += message.tokens or 0
+            
+            for call in message.tool_calls:
+                tool_calls.append(ToolCall(
+                    id=call.get("id", f"tool_{len(tool_calls)}"),
+                    tool_name=call.get("name", "unknown"),
+                    message_id=message.id,
+                    timestamp=message.timestamp,
+                    parameters=call.get("input") or {},
+                    result=call.get("result"),
+                    status=ToolCallStatus.ERROR if call.get("is_error") else ToolCallStatus.SUCCESS,
+                ))
         
         # Parse artifacts
         artifacts = []
+        type_members = ArtifactType._value2member_map_
         for art_data in data.get("artifacts", []):
+            art_type = art_data.get("type", "code")
+            type_member = type_members.get(art_type) if isinstance(art_type, str) else None
+            if type_member is None:
+                logger.warning(f"Failed to parse artifact: {art_type!r} is not a valid ArtifactType")
+                continue
+            
             try:
                 artifact = Artifact(
                     id=art_data.get("id", f"art_{len(artifacts)}"),
-                    type=ArtifactType(art_data.get("type", "code")),
+                    type=type_member,
                     title=art_data.get("title", "Untitled"),
                     content=art_data.get("content", ""),
                     language=art_data.get("language"),
                     created_in_message=art_data.get("created_in_message", ""),
-                    created_at=datetime.now(),
+                    created_at=(
+                        datetime.fromisoformat(art_data["created_at"])
+                        if "created_at" in art_data else datetime.now()
+                    ),
+                    version=art_data.get("version", 1),
                 )
                 artifacts.append(artifact)
             except Exception as e:
                 logger.warning(f"Failed to parse artifact: {e}")
                 continue
         
+        # Group messages into branches, "main" (the active thread) first
+        branch_messages: Dict[str, List[Message]] = {"main": []}
+        for message in messages:
+            branch_messages.setdefault(message.branch_id, []).append(message)
+        branches = [
+            Branch(
+                id=branch_id,
+                parent_message_id=(branch[0].parent_id or "") if branch else "",
+                created_at=branch[0].timestamp if branch else datetime.now(),
+                is_active=branch_id == "main",
+                message_ids=[m.id for m in branch],
+            )
+            for branch_id, branch in branch_messages.items()
+        ]
+        
         # Calculate statistics
         stats = ConversationStatistics(
             total_messages=len(messages),
-            user_messages=len([m for m in messages if m.role == MessageRole.USER]),
-            assistant_messages=len([m for m in messages if m.role == MessageRole.ASSISTANT]),
+            user_messages=user_messages,
+            assistant_messages=assistant_messages,
             artifact_count=len(artifacts),
-            total_tokens=sum(m.tokens or 0 for m in messages),
+            tool_call_count=len(tool_calls),
+            branch_count=len(branches),
+            total_tokens=total_tokens,
         )
         
         # Create metadata
@@ -331,14 +804,8 @@ class HybridExtractor:
             metadata=metadata,
             messages=messages,
             artifacts=artifacts,
-            branches=[Branch(
-                id="main",
-                parent_message_id="",
-                created_at=datetime.now(),
-                is_active=True,
-                message_ids=[m.id for m in messages],
-            )],
-            tool_calls=[],
+            branches=branches,
+            tool_calls=tool_calls,
             statistics=stats,
             extraction_metadata={
                 "extracted_at": datetime.now().isoformat(),
@@ -356,13 +823,7 @@ class HybridExtractor:
         # Handle both formats:
         # https://claude.ai/chat/CONVERSATION_ID
         # https://claude.ai/chat/CONVERSATION_ID?...
-        parsed = urlparse(url)
-        path_parts = parsed.path.split("/")
-        
-        # Find 'chat' in path and get next part
-        try:
-            chat_index = path_parts.index("chat")
-            conversation_id = path_parts[chat_index + 1]
-            return conversation_id
-        except (ValueError, IndexError):
+        match = _CHAT_ID_RE.match(url)
+        if match is None:
             raise ExtractionError(f"Invalid conversation URL: {url}")
+        return match.group(1)
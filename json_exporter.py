@@ -5,15 +5,53 @@ Exports conversations in a flat, easily parseable JSON structure
 optimized for AI/LLM consumption and RAG systems.
 """
 
+import hashlib
 import json
-from datetime import datetime
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict
+from types import GeneratorType
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
 
 from loguru import logger
 
 from claude_extractor.models import Conversation
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# mkstemp creates files readable only by their owner; renamed-in outputs
+# get the permissions a plain open() would give instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Bumped whenever the encoded bytes change, so stale cached exports miss
+_CACHE_FORMAT = "2"
+
+
+def _replace_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    """
+    Call write on a sibling temp file, then rename it over path.
+    
+    A failure partway leaves any existing file at path untouched and
+    removes the temp file. Each call gets its own temp file, so concurrent
+    writes to the same path don't interfere; the last rename wins.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(fd)
+    tmp = Path(name)
+    try:
+        write(tmp)
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
 class JSONExporter:
     """
@@ -31,6 +69,8 @@ class JSONExporter:
         pretty: bool = True,
         indent: int = 2,
         include_metadata: bool = True,
+        cache_dir: Optional[Path] = None,
+        cache_max_entries: int = 256,
     ):
         """
         Initialize JSON exporter.
@@ -39,10 +79,16 @@ class JSONExporter:
             pretty: Pretty print with indentation
             indent: Number of spaces for indentation
             include_metadata: Include extraction metadata
+            cache_dir: Directory for reusing previous exports of unchanged
+                conversations (disabled when None)
+            cache_max_entries: Cached exports kept before the least
+                recently used are evicted
         """
         self.pretty = pretty
         self.indent = indent if pretty else None
         self.include_metadata = include_metadata
+        self.cache_dir = cache_dir
+        self.cache_max_entries = cache_max_entries
     
     def export(self, conversation: Conversation, output_path: Path) -> None:
         """
@@ -54,16 +100,85 @@ class JSONExporter:
         """
         logger.info(f"Exporting conversation to JSON: {output_path}")
         
-        # Convert to dictionary
-        data = self._conversation_to_dict(conversation)
-        
-        # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=self.indent, ensure_ascii=False, default=str)
+        
+        if self.cache_dir is None:
+            self._write_file(conversation, output_path)
+        else:
+            self._export_cached(conversation, output_path)
         
         logger.success(f"JSON export complete: {output_path}")
     
+    def _write_file(self, conversation: Conversation, path: Path) -> None:
+        """Write the conversation JSON to path, replacing it atomically."""
+        def write(tmp: Path) -> None:
+            # Stream to file one section / array item at a time, so the
+            # full document is never held in memory
+            with open(tmp, "wb") as f:
+                self._write_sections(f, self._iter_sections(conversation))
+        
+        _replace_atomically(path, write)
+    
+    def _cache_key(self, conversation: Conversation) -> str:
+        """
+        Key a conversation's export by what changes when it does.
+        
+        A conversation gains messages (and tokens) and a newer updated_at
+        whenever it changes. The exporter settings are part of the key
+        because they change the output bytes.
+        """
+        metadata = conversation.metadata
+        key = "|".join((
+            _CACHE_FORMAT,
+            metadata.id,
+            metadata.updated_at.isoformat(),
+            str(len(conversation.messages)),
+            str(conversation.statistics.total_tokens),
+            str(self.indent),
+            str(self.include_metadata),
+        ))
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _export_cached(self, conversation: Conversation, output_path: Path) -> None:
+        """
+        Copy a cached export for the conversation, writing it on a miss.
+        
+        A hit reuses the earlier export byte for byte, including its
+        extraction metadata.
+        """
+        cache_dir = self.cache_dir
+        cached = cache_dir / f"{self._cache_key(conversation)}.json"
+        
+        if cached.is_file():
+            logger.debug(f"Reusing cached JSON export: {cached}")
+            _replace_atomically(output_path, lambda tmp: shutil.copyfile(cached, tmp))
+            try:
+                os.utime(cached)  # Mark as recently used
+            except OSError:
+                pass
+            return
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_file(conversation, cached)
+        _replace_atomically(output_path, lambda tmp: shutil.copyfile(cached, tmp))
+        self._evict_cache()
+    
+    def _evict_cache(self) -> None:
+        """Remove the least recently used exports beyond cache_max_entries."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue  # Removed by a concurrent export
+        
+        excess = len(entries) - self.cache_max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+    
     def export_string(self, conversation: Conversation) -> str:
         """
         Export conversation to JSON string.
@@ -75,7 +190,72 @@ class JSONExporter:
             JSON string
         """
         data = self._conversation_to_dict(conversation)
-        return json.dumps(data, indent=self.indent, ensure_ascii=False, default=str)
+        return self._encode(data).decode("utf-8")
+    
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        """
+        Encode data as UTF-8 JSON, using orjson when it is installed.
+        
+        orjson only supports 2-space indentation, so other indents use the
+        stdlib encoder. Datetimes and dataclasses are passed through to
+        default=str to match the stdlib output, and compact output uses
+        orjson's separators either way.
+        """
+        if orjson is not None and self.indent in (None, 2):
+            option = (
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, default=str, option=option)
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits; the stdlib handles them
+        
+        return json.dumps(
+            data,
+            indent=self.indent,
+            separators=None if self.indent else (",", ":"),
+            ensure_ascii=False,
+            default=str,
+        ).encode("utf-8")
+    
+    def _write_sections(
+        self,
+        f: BinaryIO,
+        sections: Iterator[Tuple[str, Any]],
+    ) -> None:
+        """
+        Write sections as one JSON object, encoding array items one by one.
+        
+        The bytes match _encode of the equivalent dict. Encoded JSON has no
+        raw newlines inside strings, so nested values are re-indented by
+        rewriting their newlines.
+        """
+        if self.indent:
+            item_sep, key_sep = b",", b": "
+            outer = b"\n" + b" " * self.indent
+            inner = outer + b" " * self.indent
+        else:
+            item_sep, key_sep = b",", b":"
+            outer = inner = b""
+        
+        f.write(b"{")
+        for i, (key, value) in enumerate(sections):
+            f.write((item_sep + outer) if i else outer)
+            f.write(self._encode(key) + key_sep)
+            if isinstance(value, GeneratorType):
+                empty = True
+                for item in value:
+                    f.write((item_sep + inner) if not empty else (b"[" + inner))
+                    f.write(self._encode(item).replace(b"\n", inner))
+                    empty = False
+                f.write(b"[]" if empty else (outer + b"]"))
+            else:
+                f.write(self._encode(value).replace(b"\n", outer))
+        f.write((b"\n" if self.indent else b"") + b"}")
     
     def _conversation_to_dict(self, conversation: Conversation) -> Dict[str, Any]:
         """
@@ -87,35 +267,58 @@ class JSONExporter:
         - All artifacts in simple array
         - Statistics readily accessible
         """
-        data = {
-            "format_version": "1.0.0",
-            "conversation_id": conversation.metadata.id,
-            "conversation_url": conversation.metadata.url,
-            "conversation_title": conversation.metadata.title,
-            "model": conversation.metadata.model,
-            "created_at": conversation.metadata.created_at.isoformat(),
-            "updated_at": conversation.metadata.updated_at.isoformat(),
+        return {
+            key: list(value) if isinstance(value, GeneratorType) else value
+            for key, value in self._iter_sections(conversation)
         }
+    
+    def _iter_sections(self, conversation: Conversation) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the export's top-level (key, value) pairs in output order.
+        
+        Array sections (messages, artifacts, branches, tool calls) are
+        yielded as generators, so a streaming writer can encode one item
+        at a time.
+        """
+        # Messages and tool calls within a turn often share a timestamp,
+        # so format each distinct datetime only once. Aware datetimes in
+        # different offsets compare equal, so the offset is part of the key.
+        iso_cache: Dict[Tuple[datetime, Optional[timedelta]], str] = {}
+        
+        def iso(dt: datetime) -> str:
+            key = (dt, dt.utcoffset())
+            text = iso_cache.get(key)
+            if text is None:
+                text = iso_cache[key] = dt.isoformat()
+            return text
+        
+        yield "format_version", "1.0.0"
+        yield "conversation_id", conversation.metadata.id
+        yield "conversation_url", conversation.metadata.url
+        yield "conversation_title", conversation.metadata.title
+        yield "model", conversation.metadata.model
+        yield "created_at", iso(conversation.metadata.created_at)
+        yield "updated_at", iso(conversation.metadata.updated_at)
         
         # Add project info if available
         if conversation.metadata.project_id:
-            data["project_id"] = conversation.metadata.project_id
-            data["project_name"] = conversation.metadata.project_name
+            yield "project_id", conversation.metadata.project_id
+            yield "project_name", conversation.metadata.project_name
         
         # Add custom instructions if available
         if conversation.metadata.custom_instructions:
-            data["custom_instructions"] = conversation.metadata.custom_instructions
+            yield "custom_instructions", conversation.metadata.custom_instructions
         
         # Add active skills
         if conversation.metadata.active_skills:
-            data["active_skills"] = conversation.metadata.active_skills
+            yield "active_skills", conversation.metadata.active_skills
         
         # Add system prompt if available
         if conversation.system_prompt:
-            data["system_prompt"] = conversation.system_prompt
+            yield "system_prompt", conversation.system_prompt
         
         # Statistics
-        data["statistics"] = {
+        yield "statistics", {
             "total_messages": conversation.statistics.total_messages,
             "user_messages": conversation.statistics.user_messages,
             "assistant_messages": conversation.statistics.assistant_messages,
@@ -131,104 +334,110 @@ class JSONExporter:
         }
         
         # Messages (flat array)
-        data["messages"] = []
-        for msg in conversation.messages:
-            msg_dict = {
-                "id": msg.id,
-                "role": msg.role.value,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat(),
-                "branch_id": msg.branch_id,
-            }
-            
-            if msg.parent_id:
-                msg_dict["parent_id"] = msg.parent_id
-            
-            if msg.tokens:
-                msg_dict["tokens"] = msg.tokens
-            
-            if msg.thinking_content:
-                msg_dict["thinking_content"] = msg.thinking_content
-            
-            if msg.artifacts:
-                msg_dict["artifacts"] = msg.artifacts
-            
-            if msg.tool_calls:
-                msg_dict["tool_calls"] = msg.tool_calls
-            
-            if msg.metadata:
-                msg_dict["metadata"] = msg.metadata
-            
-            data["messages"].append(msg_dict)
+        def iter_messages() -> Iterator[Dict[str, Any]]:
+            for msg in conversation.messages:
+                msg_dict = {
+                    "id": msg.id,
+                    "role": msg.role.value,
+                    "content": msg.content,
+                    "timestamp": iso(msg.timestamp),
+                    "branch_id": msg.branch_id,
+                }
+                
+                if msg.parent_id:
+                    msg_dict["parent_id"] = msg.parent_id
+                
+                if msg.tokens:
+                    msg_dict["tokens"] = msg.tokens
+                
+                if msg.thinking_content:
+                    msg_dict["thinking_content"] = msg.thinking_content
+                
+                if msg.artifacts:
+                    msg_dict["artifacts"] = msg.artifacts
+                
+                if msg.tool_calls:
+                    msg_dict["tool_calls"] = msg.tool_calls
+                
+                if msg.metadata:
+                    msg_dict["metadata"] = msg.metadata
+                
+                yield msg_dict
+        
+        yield "messages", iter_messages()
         
         # Artifacts (flat array)
-        data["artifacts"] = []
-        for art in conversation.artifacts:
-            art_dict = {
-                "id": art.id,
-                "type": art.type.value,
-                "title": art.title,
-                "content": art.content,
-                "created_in_message": art.created_in_message,
-                "created_at": art.created_at.isoformat(),
-                "version": art.version,
-            }
-            
-            if art.language:
-                art_dict["language"] = art.language
-            
-            if art.version_history:
-                art_dict["version_history"] = art.version_history
-            
-            if art.metadata:
-                art_dict["metadata"] = art.metadata
-            
-            data["artifacts"].append(art_dict)
+        def iter_artifacts() -> Iterator[Dict[str, Any]]:
+            for art in conversation.artifacts:
+                art_dict = {
+                    "id": art.id,
+                    "type": art.type.value,
+                    "title": art.title,
+                    "content": art.content,
+                    "created_in_message": art.created_in_message,
+                    "created_at": iso(art.created_at),
+                    "version": art.version,
+                }
+                
+                if art.language:
+                    art_dict["language"] = art.language
+                
+                if art.version_history:
+                    art_dict["version_history"] = art.version_history
+                
+                if art.metadata:
+                    art_dict["metadata"] = art.metadata
+                
+                yield art_dict
+        
+        yield "artifacts", iter_artifacts()
         
         # Branches
-        data["branches"] = []
-        for branch in conversation.branches:
-            branch_dict = {
-                "id": branch.id,
-                "parent_message_id": branch.parent_message_id,
-                "created_at": branch.created_at.isoformat(),
-                "is_active": branch.is_active,
-                "message_ids": branch.message_ids,
-            }
-            
-            if branch.name:
-                branch_dict["name"] = branch.name
-            
-            if branch.metadata:
-                branch_dict["metadata"] = branch.metadata
-            
-            data["branches"].append(branch_dict)
+        def iter_branches() -> Iterator[Dict[str, Any]]:
+            for branch in conversation.branches:
+                branch_dict = {
+                    "id": branch.id,
+                    "parent_message_id": branch.parent_message_id,
+                    "created_at": iso(branch.created_at),
+                    "is_active": branch.is_active,
+                    "message_ids": branch.message_ids,
+                }
+                
+                if branch.name:
+                    branch_dict["name"] = branch.name
+                
+                if branch.metadata:
+                    branch_dict["metadata"] = branch.metadata
+                
+                yield branch_dict
+        
+        yield "branches", iter_branches()
         
         # Tool calls
-        data["tool_calls"] = []
-        for tool in conversation.tool_calls:
-            tool_dict = {
-                "id": tool.id,
-                "tool_name": tool.tool_name,
-                "message_id": tool.message_id,
-                "timestamp": tool.timestamp.isoformat(),
-                "parameters": tool.parameters,
-                "status": tool.status.value,
-            }
-            
-            if tool.result:
-                tool_dict["result"] = tool.result
-            
-            if tool.error:
-                tool_dict["error"] = tool.error
-            
-            if tool.execution_time_ms:
-                tool_dict["execution_time_ms"] = tool.execution_time_ms
-            
-            data["tool_calls"].append(tool_dict)
+        def iter_tool_calls() -> Iterator[Dict[str, Any]]:
+            for tool in conversation.tool_calls:
+                tool_dict = {
+                    "id": tool.id,
+                    "tool_name": tool.tool_name,
+                    "message_id": tool.message_id,
+                    "timestamp": iso(tool.timestamp),
+                    "parameters": tool.parameters,
+                    "status": tool.status.value,
+                }
+                
+                if tool.result:
+                    tool_dict["result"] = tool.result
+                
+                if tool.error:
+                    tool_dict["error"] = tool.error
+                
+                if tool.execution_time_ms:
+                    tool_dict["execution_time_ms"] = tool.execution_time_ms
+                
+                yield tool_dict
+        
+        yield "tool_calls", iter_tool_calls()
         
         # Extraction metadata
         if self.include_metadata and conversation.extraction_metadata:
-            data["extraction_metadata"] = conversation.extraction_metadata
-        
-        return data
+            yield "extraction_metadata", conversation.extraction_metadata
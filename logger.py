@@ -16,6 +16,7 @@ def setup_logger(
     log_file: Optional[Path] = None,
     rotation: str = "10 MB",
     retention: str = "7 days",
+    fast: bool = True,
 ) -> logger:
     """
     Set up logger with rich formatting.
@@ -25,6 +26,9 @@ def setup_logger(
         log_file: Optional file path for log output
         rotation: Log file rotation size
         retention: Log file retention period
+        fast: Use a plain console format without colors, the calling
+            function or variable-annotated tracebacks, which keeps DEBUG
+            logging cheap in tight loops
     
     Returns:
         Configured logger instance
@@ -32,13 +36,23 @@ def setup_logger(
     # Remove default handler
     logger.remove()
     
-    # Add console handler with colors
-    logger.add(
-        sys.stderr,
-        level=level,
-        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-        colorize=True,
-    )
+    if fast:
+        logger.add(
+            sys.stderr,
+            level=level,
+            format="{time:HH:mm:ss} | {level: <8} | {message}",
+            colorize=False,
+            diagnose=False,
+            backtrace=False,
+        )
+    else:
+        # Add console handler with colors
+        logger.add(
+            sys.stderr,
+            level=level,
+            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+            colorize=True,
+        )
     
     # Add file handler if specified
     if log_file:
@@ -50,6 +64,9 @@ def setup_logger(
             rotation=rotation,
             retention=retention,
             compression="zip",
+            # Write from a background thread so file I/O doesn't block the
+            # event loop driving the browser
+            enqueue=True,
         )
     
     return logger
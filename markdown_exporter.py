@@ -9,14 +9,41 @@ Generates beautiful, readable Markdown reports with:
 - Tool usage analysis
 """
 
+import io
+import os
+import tempfile
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, TextIO
 
 from loguru import logger
 
 from claude_extractor.models import Artifact, Conversation, Message, MessageRole
 
+# mkstemp creates files readable only by their owner; renamed-in outputs
+# get the permissions a plain open() would give instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@lru_cache(maxsize=1024)
+def _minute_prefix(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """Format the date and minute part of a report timestamp."""
+    return datetime(year, month, day, hour, minute).strftime("%Y-%m-%d %H:%M")
+
+
+def _format_timestamp(dt: datetime) -> str:
+    """
+    Format dt as YYYY-MM-DD HH:MM:SS.
+    
+    Messages cluster within a few minutes, so the strftime call is cached
+    per minute and only the seconds are formatted each time.
+    """
+    prefix = _minute_prefix(dt.year, dt.month, dt.day, dt.hour, dt.minute)
+    return f"{prefix}:{dt.second:02d}"
+
 
 class MarkdownExporter:
     """
@@ -26,6 +53,11 @@ class MarkdownExporter:
     and optional Mermaid diagrams for visualization.
     """
     
+    # (emoji, display name) per role; anything else renders as Claude.
+    # MessageRole is a str enum, so plain "user" values hit the same key.
+    _ROLE_META = {MessageRole.USER: ("👤", "User")}
+    _DEFAULT_ROLE_META = ("🤖", "Claude")
+    
     def __init__(
         self,
         include_statistics: bool = True,
@@ -57,13 +89,25 @@ class MarkdownExporter:
         """
         logger.info(f"Exporting conversation to Markdown: {output_path}")
         
-        # Generate Markdown content
-        markdown = self._generate_markdown(conversation)
-        
-        # Write to file
+        # Stream sections straight into a large file buffer, so the whole
+        # report is never held in memory (\n line endings on every platform).
+        # The report goes to a temp file renamed into place, so a failure
+        # never leaves a partial report or clobbers an earlier one.
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        fd, name = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f".{output_path.name}."
+        )
+        tmp = Path(name)
+        try:
+            with open(
+                fd, "w", encoding="utf-8", newline="\n", buffering=1 << 20
+            ) as f:
+                self._write_markdown(conversation, f)
+            os.chmod(tmp, 0o666 & ~_UMASK)
+            os.replace(tmp, output_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         
         logger.success(f"Markdown export complete: {output_path}")
     
@@ -81,62 +125,74 @@ class MarkdownExporter:
     
     def _generate_markdown(self, conversation: Conversation) -> str:
         """Generate complete Markdown report."""
-        sections = []
+        buf = io.StringIO()
+        self._write_markdown(conversation, buf)
+        return buf.getvalue()
+    
+    def _write_markdown(self, conversation: Conversation, buf: TextIO) -> None:
+        """
+        Write the complete Markdown report to buf.
         
-        # Header
-        sections.append(self._generate_header(conversation))
+        Sections write straight into the shared buffer, separated by a blank
+        line, so the report is built in one pass instead of joining each
+        section's lines and then joining the sections again.
+        """
+        sections = [self._generate_header]
         
         # Summary Statistics
         if self.include_statistics:
-            sections.append(self._generate_statistics(conversation))
+            sections.append(self._generate_statistics)
         
         # Conversation Flow Diagram
         if self.include_mermaid:
-            sections.append(self._generate_mermaid(conversation))
+            sections.append(self._generate_mermaid)
         
         # Full Conversation
-        sections.append(self._generate_conversation(conversation))
+        sections.append(self._generate_conversation)
         
         # Artifacts
         if self.include_artifacts and conversation.artifacts:
-            sections.append(self._generate_artifacts(conversation))
+            sections.append(self._generate_artifacts)
         
         # Tool Usage Analysis
         if self.include_tool_analysis and conversation.tool_calls:
-            sections.append(self._generate_tool_analysis(conversation))
+            sections.append(self._generate_tool_analysis)
         
         # System Configuration
-        sections.append(self._generate_system_config(conversation))
+        sections.append(self._generate_system_config)
         
         # Footer
-        sections.append(self._generate_footer(conversation))
+        sections.append(self._generate_footer)
         
-        return "\n\n".join(sections)
+        for i, generate in enumerate(sections):
+            if i:
+                buf.write("\n\n")
+            generate(conversation, buf)
     
-    def _generate_header(self, conversation: Conversation) -> str:
+    def _generate_header(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate report header."""
         meta = conversation.metadata
-        return f"""# Conversation Export Report
+        buf.write(f"""# Conversation Export Report
 
 **Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  
 **Source**: [{meta.url}]({meta.url})  
 **Conversation ID**: `{meta.id}`  
 **Title**: {meta.title}
 
----"""
+---""")
     
-    def _generate_statistics(self, conversation: Conversation) -> str:
+    def _generate_statistics(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate statistics section."""
         stats = conversation.statistics
         meta = conversation.metadata
         
-        return f"""## 📊 Summary Statistics
+        buf.write(f"""## 📊 Summary Statistics
 
 | Metric | Value |
 |--------|-------|
 | **Model** | {meta.model} |
-| **Created** | {meta.created_at.strftime("%Y-%m-%d %H:%M:%S")} |
-| **Last Updated** | {meta.updated_at.strftime("%Y-%m-%d %H:%M:%S")} |
+| **Created** | {_format_timestamp(meta.created_at)} |
+| **Last Updated** | {_format_timestamp(meta.updated_at)} |
 | **Total Messages** | {stats.total_messages} |
 | **User Messages** | {stats.user_messages} |
 | **Assistant Messages** | {stats.assistant_messages} |
@@ -148,67 +204,65 @@ class MarkdownExporter:
 | **Branches** | {stats.branch_count} |
 | **Duration** | {stats.conversation_duration_minutes:.1f} minutes |
 
----"""
+---""")
     
-    def _generate_mermaid(self, conversation: Conversation) -> str:
+    def _generate_mermaid(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate Mermaid diagram of conversation flow."""
-        lines = ["## 🌳 Conversation Structure", "", "```mermaid", "graph TD"]
+        buf.write("## 🌳 Conversation Structure\n\n```mermaid\ngraph TD\n")
         
         # Simplified flow for first 10 messages
         messages = conversation.messages[:10]
         for i, msg in enumerate(messages):
             node_id = f"M{i}"
-            role = "User" if msg.role == MessageRole.USER else "Claude"
+            role = self._ROLE_META.get(msg.role, self._DEFAULT_ROLE_META)[1]
             label = f"{role}: {msg.content[:30]}..."
             
             # Escape special characters for Mermaid
             label = label.replace('"', "'").replace("[", "(").replace("]", ")")
             
-            lines.append(f'    {node_id}["{label}"]')
+            buf.write(f'    {node_id}["{label}"]\n')
             
             if i > 0:
-                lines.append(f"    M{i-1} --> {node_id}")
+                buf.write(f"    M{i-1} --> {node_id}\n")
         
         if len(conversation.messages) > 10:
-            lines.append(f'    M9 --> More["... {len(conversation.messages) - 10} more messages"]')
-        
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
+            buf.write(f'    M9 --> More["... {len(conversation.messages) - 10} more messages"]\n')
         
-        return "\n".join(lines)
+        buf.write("```\n\n---")
     
-    def _generate_conversation(self, conversation: Conversation) -> str:
+    def _generate_conversation(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate full conversation transcript."""
-        lines = ["## 💬 Full Conversation", ""]
+        buf.write("## 💬 Full Conversation\n\n")
         
-        for i, msg in enumerate(conversation.messages, 1):
-            lines.append(self._format_message(i, msg, conversation))
-            lines.append("")
+        # Index artifacts once instead of scanning them per reference;
+        # built in reverse so the first artifact with a given ID wins
+        artifacts_by_id = {art.id: art for art in reversed(conversation.artifacts)}
         
-        lines.append("---")
+        for i, msg in enumerate(conversation.messages, 1):
+            self._format_message(i, msg, artifacts_by_id, buf)
+            buf.write("\n\n")
         
-        return "\n".join(lines)
+        buf.write("---")
     
     def _format_message(
         self,
         turn: int,
         msg: Message,
-        conversation: Conversation,
-    ) -> str:
-        """Format a single message."""
-        role_emoji = "👤" if msg.role == MessageRole.USER else "🤖"
-        role_name = "User" if msg.role == MessageRole.USER else "Claude"
-        
-        lines = [
-            f"### Turn {turn}: {role_emoji} {role_name}",
-            f"*{msg.timestamp.strftime('%Y-%m-%d %H:%M:%S')} • Branch: {msg.branch_id}*",
-            "",
-        ]
+        artifacts_by_id: Dict[str, Artifact],
+        buf: TextIO,
+    ) -> None:
+        """Format a single message, ending with a newline."""
+        role_emoji, role_name = self._ROLE_META.get(msg.role, self._DEFAULT_ROLE_META)
+        
+        buf.write(
+            f"### Turn {turn}: {role_emoji} {role_name}\n"
+            f"*{_format_timestamp(msg.timestamp)} • Branch: {msg.branch_id}*\n\n"
+        )
         
         # Message content
-        lines.append("> " + msg.content.replace("\n", "\n> "))
-        lines.append("")
+        buf.write("> ")
+        buf.write(msg.content.replace("\n", "\n> "))
+        buf.write("\n")
         
         # Metadata
         metadata_items = []
@@ -220,143 +274,115 @@ class MarkdownExporter:
             metadata_items.append(f"Tools Used: {len(msg.tool_calls)}")
         
         if metadata_items:
-            lines.append("**Metadata**: " + " | ".join(metadata_items))
-            lines.append("")
+            buf.write("\n**Metadata**: " + " | ".join(metadata_items) + "\n")
         
         # Thinking content
         if msg.thinking_content:
-            lines.append("<details>")
-            lines.append("<summary><b>💭 Thinking Process</b></summary>")
-            lines.append("")
-            lines.append("```")
-            lines.append(msg.thinking_content)
-            lines.append("```")
-            lines.append("</details>")
-            lines.append("")
+            buf.write("\n<details>\n<summary><b>💭 Thinking Process</b></summary>\n\n```\n")
+            buf.write(msg.thinking_content)
+            buf.write("\n```\n</details>\n")
         
         # Tool calls
         if msg.tool_calls:
-            lines.append("**🔧 Tools Used**:")
+            buf.write("\n**🔧 Tools Used**:\n")
             for tool_call in msg.tool_calls:
-                lines.append(f"- `{tool_call.get('tool_name', 'unknown')}(...)`")
-            lines.append("")
+                buf.write(f"- `{tool_call.get('tool_name', 'unknown')}(...)`\n")
         
         # Artifacts
         if msg.artifacts:
-            lines.append("**🎨 Artifacts Created**:")
-            for art_id in msg.artifacts:
-                art = next((a for a in conversation.artifacts if a.id == art_id), None)
-                if art:
-                    lines.append(f"- [{art.title}](#artifact-{art_id}) ({art.type.value})")
-            lines.append("")
-        
-        return "\n".join(lines)
+            buf.write("\n**🎨 Artifacts Created**:\n")
+            buf.write("".join(
+                f"- [{art.title}](#artifact-{art_id}) ({art.type.value})\n"
+                for art_id in msg.artifacts
+                if (art := artifacts_by_id.get(art_id))
+            ))
     
-    def _generate_artifacts(self, conversation: Conversation) -> str:
+    def _generate_artifacts(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate artifacts section."""
-        lines = ["## 🎨 Artifacts", ""]
+        buf.write("## 🎨 Artifacts\n\n")
         
         for i, art in enumerate(conversation.artifacts, 1):
-            lines.append(f"### Artifact {i}: {art.title}")
-            lines.append(f"<span id=\"artifact-{art.id}\"></span>")
-            lines.append("")
-            lines.append(f"**Type**: {art.type.value}")
+            if i > 1:
+                buf.write("\n")
+            buf.write(
+                f"### Artifact {i}: {art.title}\n"
+                f"<span id=\"artifact-{art.id}\"></span>\n\n"
+                f"**Type**: {art.type.value}\n"
+            )
             if art.language:
-                lines.append(f"**Language**: {art.language}")
-            lines.append(f"**Created**: {art.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append(f"**Version**: {art.version}")
-            lines.append("")
+                buf.write(f"**Language**: {art.language}\n")
+            buf.write(
+                f"**Created**: {_format_timestamp(art.created_at)}\n"
+                f"**Version**: {art.version}\n\n"
+            )
             
             # Content
             if art.type.value == "code" or art.language:
                 lang = art.language or ""
-                lines.append(f"```{lang}")
-                lines.append(art.content)
-                lines.append("```")
+                buf.write(f"```{lang}\n")
+                buf.write(art.content)
+                buf.write("\n```")
             else:
-                lines.append(art.content)
+                buf.write(art.content)
             
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-        
-        return "\n".join(lines)
+            buf.write("\n\n---\n")
     
-    def _generate_tool_analysis(self, conversation: Conversation) -> str:
+    def _generate_tool_analysis(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate tool usage analysis."""
-        lines = ["## 🔧 Tool Usage Analysis", ""]
-        
-        # Count tool usage
-        tool_counts = {}
-        for tool in conversation.tool_calls:
-            name = tool.tool_name
-            tool_counts[name] = tool_counts.get(name, 0) + 1
+        buf.write("## 🔧 Tool Usage Analysis\n\n")
         
-        # Sort by usage
-        sorted_tools = sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)
+        # Count tool usage, most used first (ties keep first-seen order)
+        sorted_tools = Counter(
+            tool.tool_name for tool in conversation.tool_calls
+        ).most_common()
         
-        lines.append("| Tool | Usage Count | % of Total |")
-        lines.append("|------|-------------|------------|")
+        buf.write("| Tool | Usage Count | % of Total |\n")
+        buf.write("|------|-------------|------------|\n")
         
         total = len(conversation.tool_calls)
         for tool_name, count in sorted_tools:
             percentage = (count / total) * 100 if total > 0 else 0
-            lines.append(f"| `{tool_name}` | {count} | {percentage:.1f}% |")
-        
-        lines.append("")
-        lines.append("---")
+            buf.write(f"| `{tool_name}` | {count} | {percentage:.1f}% |\n")
         
-        return "\n".join(lines)
+        buf.write("\n---")
     
-    def _generate_system_config(self, conversation: Conversation) -> str:
+    def _generate_system_config(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate system configuration section."""
         meta = conversation.metadata
-        lines = ["## ⚙️ System Configuration", ""]
+        buf.write("## ⚙️ System Configuration\n\n")
         
         # Custom instructions
         if meta.custom_instructions:
-            lines.append("### Custom Instructions")
-            lines.append("```")
-            lines.append(meta.custom_instructions)
-            lines.append("```")
-            lines.append("")
+            buf.write("### Custom Instructions\n```\n")
+            buf.write(meta.custom_instructions)
+            buf.write("\n```\n\n")
         
         # Active skills
         if meta.active_skills:
-            lines.append("### Active Skills")
+            buf.write("### Active Skills\n")
             for skill in meta.active_skills:
-                lines.append(f"- {skill}")
-            lines.append("")
+                buf.write(f"- {skill}\n")
+            buf.write("\n")
         
         # System prompt
         if conversation.system_prompt:
-            lines.append("<details>")
-            lines.append("<summary><b>System Prompt</b></summary>")
-            lines.append("")
-            lines.append("```")
-            lines.append(conversation.system_prompt)
-            lines.append("```")
-            lines.append("</details>")
-            lines.append("")
-        
-        lines.append("---")
-        
-        return "\n".join(lines)
+            buf.write("<details>\n<summary><b>System Prompt</b></summary>\n\n```\n")
+            buf.write(conversation.system_prompt)
+            buf.write("\n```\n</details>\n\n")
+        
+        buf.write("---")
     
-    def _generate_footer(self, conversation: Conversation) -> str:
+    def _generate_footer(self, conversation: Conversation, buf: TextIO) -> None:
         """Generate report footer."""
         extraction_meta = conversation.extraction_metadata
         
-        lines = ["## 📋 Export Information", ""]
+        buf.write("## 📋 Export Information\n\n")
         
         if extraction_meta:
-            lines.append(f"- **Extracted At**: {extraction_meta.get('extracted_at', 'Unknown')}")
-            lines.append(f"- **Extractor Version**: {extraction_meta.get('extractor_version', 'Unknown')}")
-            lines.append(f"- **Extraction Method**: {extraction_meta.get('method', 'Unknown')}")
-        
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        lines.append("*Generated by Claude Conversation Extractor*")
+            buf.write(
+                f"- **Extracted At**: {extraction_meta.get('extracted_at', 'Unknown')}\n"
+                f"- **Extractor Version**: {extraction_meta.get('extractor_version', 'Unknown')}\n"
+                f"- **Extraction Method**: {extraction_meta.get('method', 'Unknown')}\n"
+            )
         
-        return "\n".join(lines)
+        buf.write("\n---\n\n*Generated by Claude Conversation Extractor*")
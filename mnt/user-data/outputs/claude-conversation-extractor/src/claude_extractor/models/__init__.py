@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageRole(str, Enum):
@@ -54,11 +54,7 @@ class Message(BaseModel):
     artifacts: List[str] = Field(default_factory=list, description="Artifact IDs in this message")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class Artifact(BaseModel):
@@ -78,11 +74,7 @@ class Artifact(BaseModel):
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class Branch(BaseModel):
@@ -96,11 +88,6 @@ class Branch(BaseModel):
     message_ids: List[str] = Field(default_factory=list, description="Message IDs in this branch")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class ToolCall(BaseModel):
     """Represents a tool call made by Claude."""
@@ -115,11 +102,7 @@ class ToolCall(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     execution_time_ms: Optional[int] = Field(None, description="Execution time in milliseconds")
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ConversationMetadata(BaseModel):
@@ -135,11 +118,6 @@ class ConversationMetadata(BaseModel):
     project_name: Optional[str] = Field(None, description="Project name if in a project")
     custom_instructions: Optional[str] = Field(None, description="User's custom instructions")
     active_skills: List[str] = Field(default_factory=list, description="Skills active in conversation")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ConversationStatistics(BaseModel):
@@ -177,36 +155,34 @@ class Conversation(BaseModel):
         description="Metadata about the extraction process"
     )
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
     def to_llm_json(self) -> Dict[str, Any]:
         """
         Export to LLM-optimized JSON format.
         
         Returns flat structure with minimal nesting for better LLM consumption.
         """
+        # Serialize the whole tree in one pass, then flatten it
+        data = self.model_dump()
+        meta = data["metadata"]
         return {
             "format_version": "1.0.0",
-            "conversation_id": self.metadata.id,
-            "conversation_url": self.metadata.url,
-            "conversation_title": self.metadata.title,
-            "model": self.metadata.model,
-            "created_at": self.metadata.created_at.isoformat(),
-            "updated_at": self.metadata.updated_at.isoformat(),
-            "project_id": self.metadata.project_id,
-            "project_name": self.metadata.project_name,
-            "total_messages": self.statistics.total_messages,
-            "total_tokens": self.statistics.total_tokens,
-            "messages": [msg.dict() for msg in self.messages],
-            "artifacts": [art.dict() for art in self.artifacts],
-            "branches": [branch.dict() for branch in self.branches],
-            "tool_calls": [tool.dict() for tool in self.tool_calls],
-            "statistics": self.statistics.dict(),
-            "system_prompt": self.system_prompt,
-            "extraction_metadata": self.extraction_metadata,
+            "conversation_id": meta["id"],
+            "conversation_url": meta["url"],
+            "conversation_title": meta["title"],
+            "model": meta["model"],
+            "created_at": meta["created_at"].isoformat(),
+            "updated_at": meta["updated_at"].isoformat(),
+            "project_id": meta["project_id"],
+            "project_name": meta["project_name"],
+            "total_messages": data["statistics"]["total_messages"],
+            "total_tokens": data["statistics"]["total_tokens"],
+            "messages": data["messages"],
+            "artifacts": data["artifacts"],
+            "branches": data["branches"],
+            "tool_calls": data["tool_calls"],
+            "statistics": data["statistics"],
+            "system_prompt": data["system_prompt"],
+            "extraction_metadata": data["extraction_metadata"],
         }
 
     def get_active_branch_messages(self) -> List[Message]:
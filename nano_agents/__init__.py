@@ -16,13 +16,31 @@ Available Agents:
 - BranchDetector: Reconstruct conversation tree structure
 """
 
-from nano_agents.url_parser import URLParser, ConversationIdentifier
-from nano_agents.api_fetcher import APIDataFetcher, FetchStrategy
-from nano_agents.branch_detector import (
-    BranchDetector,
-    ConversationTree,
-    MessageNode
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from nano_agents.url_parser import URLParser, ConversationIdentifier
+    from nano_agents.api_fetcher import APIDataFetcher, FetchStrategy
+    from nano_agents.branch_detector import (
+        BranchDetector,
+        ConversationTree,
+        MessageNode,
+        TreeArrays
+    )
+
+# Agents are imported on first attribute access (PEP 562), so importing
+# one agent doesn't load the others and their dependencies
+_LAZY_IMPORTS = {
+    'URLParser': 'nano_agents.url_parser',
+    'ConversationIdentifier': 'nano_agents.url_parser',
+    'APIDataFetcher': 'nano_agents.api_fetcher',
+    'FetchStrategy': 'nano_agents.api_fetcher',
+    'BranchDetector': 'nano_agents.branch_detector',
+    'ConversationTree': 'nano_agents.branch_detector',
+    'MessageNode': 'nano_agents.branch_detector',
+    'TreeArrays': 'nano_agents.branch_detector',
+}
 
 __all__ = [
     'URLParser',
@@ -32,6 +50,20 @@ __all__ = [
     'BranchDetector',
     'ConversationTree',
     'MessageNode',
+    'TreeArrays',
 ]
 
 __version__ = '0.1.0'
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -22,10 +22,80 @@ Example Usage:
 """
 
 import asyncio
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import Optional, Any, Iterator, Union
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
 import json
+import mmap
+import os
+
+# Declared Optional so type checkers treat the fallback branches as reachable
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+
+def _loads(raw: Union[bytes, memoryview]) -> Any:
+    """
+    Parse JSON bytes, preferring orjson when it is installed.
+    
+    orjson parses a memoryview in place; the stdlib fallback needs a copy.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to handle the stdlib exception type.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    return json.loads(raw)
+
+
+def _load_file(filepath: Path) -> Any:
+    """
+    Parse a JSON file through a read-only memory map.
+    
+    The page cache backs the parse directly, so no userspace copy of the
+    file is made (with orjson). The parser reads front to back, so the
+    kernel is told to read ahead aggressively where madvise is available.
+    Empty files can't be mapped and are parsed as empty input, which
+    raises json.JSONDecodeError.
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as buf:
+                return _loads(buf)
+
+
+def _copy_json(value: Any) -> Any:
+    """
+    Copy parsed JSON containers (dicts and lists) recursively.
+    
+    Leaves are immutable JSON scalars, so they are shared; this is several
+    times faster than copy.deepcopy, which memoizes every object.
+    """
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _safe_div(numerator: float, denominator: float) -> float:
+    """Divide, returning 0 when the denominator is zero."""
+    return numerator / denominator if denominator > 0 else 0
 
 
 class FetchStrategy(Enum):
@@ -54,14 +124,31 @@ class APIDataFetcher:
     - Success rate: 95%+ across all strategies
     """
     
-    def __init__(self, auth_token: Optional[str] = None) -> None:
+    # Max parsed export files kept in memory by fetch_from_file
+    DEFAULT_CACHE_SIZE = 32
+    
+    # (strategy, metrics key) pairs, computed once for get_metrics
+    _STRATEGY_ITEMS = tuple((s, s.value) for s in FetchStrategy)
+    
+    def __init__(
+        self,
+        auth_token: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
         """
         Initialize fetcher with authentication.
         
         Args:
             auth_token: Claude session token (optional for Phase 1)
+            cache_size: Max parsed export files to keep in the LRU cache
+                (0 disables caching)
         """
         self.auth_token = auth_token
+        self.cache_size = cache_size
+        # (path, mtime_ns, size) -> validated conversation data
+        self._load_cache: OrderedDict[tuple[str, int, int], dict[str, Any]] = (
+            OrderedDict()
+        )
         self.strategy_attempts: dict[FetchStrategy, int] = {
             s: 0 for s in FetchStrategy
         }
@@ -99,6 +186,11 @@ class APIDataFetcher:
         """
         Load conversation from manually exported file.
         
+        Results are cached by (path, mtime, size), so reloading an unchanged
+        file skips reading, parsing and validating it. Every call returns
+        its own copy of the cached data, so callers may modify the result
+        without affecting later fetches.
+        
         Args:
             filepath: Path to JSON file from manual export
             
@@ -107,7 +199,7 @@ class APIDataFetcher:
             
         Raises:
             FileNotFoundError: If file doesn't exist
-            json.JSONDecodeError: If file is not valid JSON
+            ValueError: If file is not valid JSON or data is invalid
             
         Examples:
             >>> fetcher = APIDataFetcher()
@@ -121,21 +213,151 @@ class APIDataFetcher:
                 f"Please export conversation from Claude.ai first"
             )
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        stat = filepath.stat()
+        cache_key = (str(filepath), stat.st_mtime_ns, stat.st_size)
+        data = self._load_cache.get(cache_key)
+        
+        if data is not None:
+            self._load_cache.move_to_end(cache_key)
+        else:
+            # Parse on a worker thread so concurrent fetches don't block the loop
+            data = await asyncio.to_thread(self._load_sync, filepath)
             
-            # Validate basic structure
-            self._validate_conversation_data(data)
+            # Only validated results reach the cache
+            if self.cache_size > 0:
+                self._load_cache[cache_key] = data
+                while len(self._load_cache) > self.cache_size:
+                    self._load_cache.popitem(last=False)
+        
+        self.strategy_successes[FetchStrategy.MANUAL] += 1
+        if self.cache_size > 0:
+            data = _copy_json(data)
+        return data
+    
+    def _load_sync(self, filepath: Path) -> dict[str, Any]:
+        """
+        Read, parse and validate an export file (blocking).
+        
+        Args:
+            filepath: Path to JSON file from manual export
             
-            self.strategy_successes[FetchStrategy.MANUAL] += 1
-            return data
+        Returns:
+            Validated conversation data dictionary
             
+        Raises:
+            ValueError: If file is not valid JSON or data is invalid
+        """
+        try:
+            data: dict[str, Any] = _load_file(filepath)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Invalid JSON in export file: {filepath}\n"
                 f"Error: {str(e)}"
             ) from e
+        
+        # Validate basic structure
+        self._validate_conversation_data(data)
+        return data
+    
+    def iter_messages(
+        self,
+        filepath: Path,
+        header: Optional[dict[str, Any]] = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream messages from a manually exported file one at a time.
+        
+        Uses ijson when installed so the full document is never held in
+        memory; otherwise falls back to a whole-file parse. The result can
+        be passed directly to BranchDetector.build_tree.
+        
+        Args:
+            filepath: Path to JSON file from manual export
+            header: If given, filled with the export's other top-level
+                fields (id, metadata, ...) once iteration completes
+            
+        Yields:
+            Message dictionaries from the export's 'messages' array
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not valid JSON or data is invalid (same
+                messages as fetch_from_file)
+            
+        Examples:
+            >>> fetcher = APIDataFetcher()
+            >>> tree = BranchDetector().build_tree(
+            ...     fetcher.iter_messages(Path("conversation.json"))
+            ... )
+        """
+        self.strategy_attempts[FetchStrategy.MANUAL] += 1
+        
+        if not filepath.exists():
+            raise FileNotFoundError(
+                f"Manual export file not found: {filepath}\n"
+                f"Please export conversation from Claude.ai first"
+            )
+        
+        if ijson is None:
+            data = self._load_sync(filepath)
+            if header is not None:
+                header.update(
+                    (key, value) for key, value in data.items() if key != 'messages'
+                )
+            yield from data['messages']
+        else:
+            # The first event under the top-level 'messages' key gives its
+            # type; it is checked before any item is yielded
+            messages_event = None
+            # Other top-level values are built alongside, one per key
+            builders: list[tuple[str, Any]] = []
+            
+            def events(f: Any) -> Iterator[tuple[str, str, Any]]:
+                nonlocal messages_event
+                builder = None
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix == '':
+                        builder = None
+                        if (
+                            event == 'map_key'
+                            and header is not None
+                            and value != 'messages'
+                        ):
+                            builder = ijson.ObjectBuilder()
+                            builders.append((value, builder))
+                    elif builder is not None:
+                        builder.event(event, value)
+                    elif prefix == 'messages' and messages_event is None:
+                        messages_event = event
+                        if event != 'start_array':
+                            raise ValueError(
+                                "Invalid conversation data: 'messages' must be a list"
+                            )
+                    yield prefix, event, value
+            
+            count = 0
+            with open(filepath, 'rb') as f:
+                try:
+                    for msg in ijson.items(events(f), 'messages.item'):
+                        count += 1
+                        yield msg
+                except ijson.JSONError as e:
+                    raise ValueError(
+                        f"Invalid JSON in export file: {filepath}\n"
+                        f"Error: {str(e)}"
+                    ) from e
+            if messages_event is None:
+                raise ValueError(
+                    "Invalid conversation data: missing 'messages' field"
+                )
+            if count == 0:
+                raise ValueError(
+                    "Invalid conversation data: 'messages' list is empty"
+                )
+            if header is not None:
+                header.update((key, builder.value) for key, builder in builders)
+        
+        self.strategy_successes[FetchStrategy.MANUAL] += 1
     
     def _validate_conversation_data(self, data: dict[str, Any]) -> None:
         """
@@ -147,6 +369,11 @@ class APIDataFetcher:
         Raises:
             ValueError: If data structure is invalid
         """
+        # Fast path for well-formed exports: one lookup, one type check
+        messages = data.get('messages') if isinstance(data, dict) else None
+        if type(messages) is list and messages:
+            return
+        
         if 'messages' not in data:
             raise ValueError(
                 "Invalid conversation data: missing 'messages' field"
@@ -274,24 +501,22 @@ class APIDataFetcher:
         total_attempts = sum(self.strategy_attempts.values())
         total_successes = sum(self.strategy_successes.values())
         
+        attempts = self.strategy_attempts
+        successes = self.strategy_successes
+        
         return {
-            "overall_success_rate": (
-                total_successes / total_attempts if total_attempts > 0 else 0
-            ),
+            "overall_success_rate": _safe_div(total_successes, total_attempts),
             "strategy_breakdown": {
-                str(s.value): {
-                    "attempts": self.strategy_attempts[s],
-                    "successes": self.strategy_successes[s],
-                    "success_rate": (
-                        self.strategy_successes[s] / self.strategy_attempts[s]
-                        if self.strategy_attempts[s] > 0 else 0
-                    )
+                key: {
+                    "attempts": attempts[s],
+                    "successes": successes[s],
+                    "success_rate": _safe_div(successes[s], attempts[s])
                 }
-                for s in FetchStrategy
+                for s, key in self._STRATEGY_ITEMS
             },
             "total_cost_usd": self.total_cost,
-            "avg_cost_per_conversation": (
-                self.total_cost / total_successes if total_successes > 0 else 0
+            "avg_cost_per_conversation": _safe_div(
+                self.total_cost, total_successes
             ),
             "phase": "1 (manual export only)"
         }
@@ -299,7 +524,7 @@ class APIDataFetcher:
 
 if __name__ == "__main__":
     # Quick test
-    async def test_fetcher():
+    async def test_fetcher() -> None:
         fetcher = APIDataFetcher()
         
         # Test manual export prompt
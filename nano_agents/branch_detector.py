@@ -21,12 +21,62 @@ Example Usage:
     >>> print(f"Found {len(tree.branches)} branches")
 """
 
+import re
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional, Any
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional, Any, Iterable, Sequence
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Fractional seconds of any length; fromisoformat before 3.11 takes only 3 or 6
+_FRACTION = re.compile(r'(?<=:\d{2})\.(\d+)')
+
+# Shared read-only default for messages without artifacts/tool calls
+_EMPTY: tuple[dict[str, Any], ...] = ()
+
+# Message schema, precomputed once for per-message validation
+_REQUIRED_FIELD_ORDER = ('id', 'role', 'content', 'timestamp')
+_REQUIRED_FIELDS = frozenset(_REQUIRED_FIELD_ORDER)
+_VALID_ROLES = frozenset({'user', 'assistant'})
+
+# dataclass(slots=True) needs Python 3.10+; plain dataclasses on 3.9
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _parse_timestamp_ns(timestamp: str) -> int:
+    """
+    Convert an ISO 8601 timestamp to integer nanoseconds since the epoch.
+    
+    Timestamps without an offset are treated as UTC. Fractional seconds of
+    any length are accepted and truncated to microseconds.
+    
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601
+    """
+    if timestamp.endswith(('Z', 'z')):
+        timestamp = timestamp[:-1] + '+00:00'
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        normalized = _FRACTION.sub(
+            lambda m: '.' + m.group(1)[:6].ljust(6, '0'), timestamp, count=1
+        )
+        if normalized == timestamp:
+            raise
+        dt = datetime.fromisoformat(normalized)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - _EPOCH
+    return (
+        (delta.days * 86_400 + delta.seconds) * 1_000_000_000
+        + delta.microseconds * 1_000
+    )
+
+
+@dataclass(**_SLOTS)
 class MessageNode:
     """
     Represents a single message in the conversation tree.
@@ -37,25 +87,28 @@ class MessageNode:
         role: Message role ('user' or 'assistant')
         content: Message text content
         timestamp: ISO 8601 timestamp
-        artifacts: List of artifacts attached to message
-        tool_calls: List of tool invocations in message
+        artifacts: Artifacts attached to message (shared empty tuple if none)
+        tool_calls: Tool invocations in message (shared empty tuple if none)
         children: Child message nodes
         branch_id: Branch identifier (e.g., 'main', 'branch_1')
         is_active: Whether this message is on the active branch
+        timestamp_ns: Timestamp as nanoseconds since the epoch (for comparisons;
+            0 if the timestamp could not be parsed)
     """
     id: str
     parent_id: Optional[str]
     role: str  # 'user' or 'assistant'
     content: str
     timestamp: str
-    artifacts: list[dict[str, Any]] = field(default_factory=list)
-    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    artifacts: Sequence[dict[str, Any]] = ()
+    tool_calls: Sequence[dict[str, Any]] = ()
     children: list['MessageNode'] = field(default_factory=list)
     branch_id: str = "main"
     is_active: bool = False
+    timestamp_ns: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationTree:
     """
     Complete conversation tree with all branches mapped.
@@ -65,11 +118,46 @@ class ConversationTree:
         nodes: Map of message_id to MessageNode
         branches: Map of branch_id to list of message IDs in that branch
         active_branch: ID of the currently active branch
+        child_counts: Map of message ID to number of children, for
+            messages with at least one child
+    
+    Trees are treated as immutable once built; BranchDetector.get_metrics
+    caches its result on the tree.
     """
     root_id: str
     nodes: dict[str, MessageNode]
     branches: dict[str, list[str]]  # branch_id -> [message_ids]
     active_branch: str = "main"
+    child_counts: dict[str, int] = field(default_factory=dict)
+    _metrics_cache: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+
+@dataclass
+class TreeArrays:
+    """
+    Struct-of-arrays view of a ConversationTree for metric queries.
+    
+    Nodes reachable from the root come first, in depth-first pre-order, so
+    every reachable node's parent has a smaller index. Unreachable (orphan)
+    nodes follow in message order. The int64 arrays support the buffer
+    protocol, so they can be wrapped by NumPy without copying.
+    
+    Attributes:
+        ids: Message IDs by node index
+        index: Map of message ID to node index
+        parent: Parent index per node (-1 for the root and orphans)
+        timestamp_ns: Timestamp per node in epoch nanoseconds
+        child_count: Number of children per node
+        reachable: Number of leading nodes reachable from the root
+    """
+    ids: list[str]
+    index: dict[str, int]
+    parent: array
+    timestamp_ns: array
+    child_count: array
+    reachable: int
 
 
 class BranchDetector:
@@ -88,12 +176,15 @@ class BranchDetector:
     - Performance: O(n) where n = number of messages
     """
     
-    def build_tree(self, messages: list[dict[str, Any]]) -> ConversationTree:
+    def build_tree(self, messages: Iterable[dict[str, Any]]) -> ConversationTree:
         """
         Build conversation tree from flat message list.
         
+        Messages are consumed in a single pass, so any iterable works,
+        including a streaming reader such as APIDataFetcher.iter_messages.
+        
         Args:
-            messages: List of message dictionaries with keys:
+            messages: Iterable of message dictionaries with keys:
                 - id: Message ID (required)
                 - parent_id: Parent message ID (None for root)
                 - role: 'user' or 'assistant' (required)
@@ -106,7 +197,7 @@ class BranchDetector:
             ConversationTree with complete branch structure
             
         Raises:
-            ValueError: If message structure is invalid
+            ValueError: If message structure is invalid or IDs are duplicated
             
         Examples:
             >>> detector = BranchDetector()
@@ -120,54 +211,80 @@ class BranchDetector:
             >>> len(tree.nodes)
             2
         """
-        if not messages:
-            raise ValueError("Cannot build tree from empty message list")
-        
-        # Validate and build node lookup
-        nodes = {}
+        # Single pass: validate, build node lookup, collect children and
+        # find the root (message with no parent)
+        nodes: dict[str, MessageNode] = {}
+        children_map: dict[str, list[MessageNode]] = {}
+        root_id: Optional[str] = None
+        has_branches = False
+        timestamps_parsed = True
         for msg in messages:
             self._validate_message(msg)
-            nodes[msg['id']] = MessageNode(
+            if msg['id'] in nodes:
+                raise ValueError(f"Duplicate message id: {msg['id']}")
+            try:
+                timestamp_ns = _parse_timestamp_ns(msg['timestamp'])
+            except (TypeError, ValueError):
+                # Unparseable timestamps fall back to string comparison
+                timestamp_ns = 0
+                timestamps_parsed = False
+            node = MessageNode(
                 id=msg['id'],
                 parent_id=msg.get('parent_id'),
-                role=msg['role'],
+                role=sys.intern(msg['role']),
                 content=msg['content'],
                 timestamp=msg['timestamp'],
-                artifacts=msg.get('artifacts', []),
-                tool_calls=msg.get('tool_calls', [])
+                timestamp_ns=timestamp_ns,
+                artifacts=msg.get('artifacts') or _EMPTY,
+                tool_calls=msg.get('tool_calls') or _EMPTY
             )
-        
-        # Build parent-child relationships
-        children_map: dict[str, list[str]] = defaultdict(list)
-        for node in nodes.values():
+            nodes[node.id] = node
+            
             if node.parent_id:
-                children_map[node.parent_id].append(node.id)
+                siblings = children_map.get(node.parent_id)
+                if siblings is None:
+                    children_map[node.parent_id] = [node]
+                else:
+                    has_branches = True
+                    siblings.append(node)
+            elif node.parent_id is None:
+                if root_id is not None:
+                    raise ValueError(
+                        f"Multiple root messages found: {[root_id, node.id]}"
+                    )
+                root_id = node.id
         
-        # Assign children to nodes
-        for parent_id, child_ids in children_map.items():
-            if parent_id in nodes:
-                nodes[parent_id].children = [nodes[cid] for cid in child_ids]
-        
-        # Find root (message with no parent)
-        root_candidates = [nid for nid, node in nodes.items() if node.parent_id is None]
-        if not root_candidates:
+        if not nodes:
+            raise ValueError("Cannot build tree from empty message list")
+        if root_id is None:
             raise ValueError("No root message found (all messages have parents)")
-        if len(root_candidates) > 1:
-            raise ValueError(f"Multiple root messages found: {root_candidates}")
         
-        root_id = root_candidates[0]
-        
-        # Detect and label branches
-        branches = self._label_branches(nodes, root_id, children_map)
+        # Assign children to nodes (parents may appear after their children)
+        child_counts: dict[str, int] = {}
+        for parent_id, children in children_map.items():
+            if parent_id in nodes:
+                nodes[parent_id].children = children
+                child_counts[parent_id] = len(children)
         
-        # Mark active branch
-        active_branch = self._find_active_branch(nodes, branches)
+        if has_branches:
+            # Detect and label branches
+            branches = self._label_branches(nodes, root_id)
+            
+            # Mark active branch
+            active_branch = self._find_active_branch(
+                nodes, branches, by_instant=timestamps_parsed
+            )
+        else:
+            # Common case: no parent has more than one child
+            branches = self._label_linear(nodes, root_id)
+            active_branch = "main"
         
         return ConversationTree(
             root_id=root_id,
             nodes=nodes,
             branches=branches,
-            active_branch=active_branch
+            active_branch=active_branch,
+            child_counts=child_counts
         )
     
     def _validate_message(self, msg: dict[str, Any]) -> None:
@@ -180,24 +297,28 @@ class BranchDetector:
         Raises:
             ValueError: If message is missing required fields
         """
-        required_fields = ['id', 'role', 'content', 'timestamp']
-        missing = [f for f in required_fields if f not in msg]
+        # Fast path: one C-level subset test plus one set lookup
+        try:
+            if msg.keys() >= _REQUIRED_FIELDS and msg['role'] in _VALID_ROLES:
+                return
+        except TypeError:
+            pass  # Unhashable role; reported below
+        
+        missing = [f for f in _REQUIRED_FIELD_ORDER if f not in msg]
         if missing:
             raise ValueError(
                 f"Message missing required fields: {missing}\n"
                 f"Message: {msg.get('id', 'unknown')}"
             )
         
-        if msg['role'] not in ['user', 'assistant']:
-            raise ValueError(
-                f"Invalid role: {msg['role']}. Must be 'user' or 'assistant'"
-            )
+        raise ValueError(
+            f"Invalid role: {msg['role']}. Must be 'user' or 'assistant'"
+        )
     
     def _label_branches(
         self,
         nodes: dict[str, MessageNode],
-        root_id: str,
-        children_map: dict[str, list[str]]
+        root_id: str
     ) -> dict[str, list[str]]:
         """
         Traverse tree and assign branch labels.
@@ -209,7 +330,6 @@ class BranchDetector:
         Args:
             nodes: Map of message ID to MessageNode
             root_id: ID of root message
-            children_map: Map of parent ID to list of child IDs
             
         Returns:
             Map of branch_id to list of message IDs in that branch
@@ -217,8 +337,17 @@ class BranchDetector:
         branches: dict[str, list[str]] = {"main": []}
         branch_counter = 0
         
-        def traverse(node_id: str, current_branch: str) -> None:
-            nonlocal branch_counter
+        # Iterative pre-order DFS. A branch of None means "start a new
+        # branch when popped", which keeps branch numbering identical to a
+        # recursive walk (first child fully explored before its siblings).
+        stack: list[tuple[str, Optional[str]]] = [(root_id, "main")]
+        while stack:
+            node_id, current_branch = stack.pop()
+            
+            if current_branch is None:
+                branch_counter += 1
+                current_branch = sys.intern(f"branch_{branch_counter}")
+                branches[current_branch] = []
             
             # Add node to current branch
             node = nodes[node_id]
@@ -226,33 +355,54 @@ class BranchDetector:
             branches[current_branch].append(node_id)
             
             # Get children
-            children = children_map.get(node_id, [])
-            
-            if len(children) == 0:
+            children = node.children
+            if not children:
                 # Leaf node - end of this path
-                return
-            elif len(children) == 1:
-                # Single child - continue on same branch
-                traverse(children[0], current_branch)
-            else:
-                # Branch point! Multiple children
-                # First child continues current branch
-                traverse(children[0], current_branch)
-                
-                # Subsequent children create new branches
-                for child_id in children[1:]:
-                    branch_counter += 1
-                    new_branch = f"branch_{branch_counter}"
-                    branches[new_branch] = []
-                    traverse(child_id, new_branch)
-        
-        traverse(root_id, "main")
+                continue
+            
+            # Subsequent children create new branches; push them first so
+            # the first child (which continues this branch) is popped next
+            for child in reversed(children[1:]):
+                stack.append((child.id, None))
+            stack.append((children[0].id, current_branch))
+        
         return branches
     
+    def _label_linear(
+        self,
+        nodes: dict[str, MessageNode],
+        root_id: str
+    ) -> dict[str, list[str]]:
+        """
+        Label a conversation that has no branch points.
+        
+        Every reachable message sits on "main", which is therefore also the
+        active branch, so no branch counter or timestamp scan is needed.
+        
+        Args:
+            nodes: Map of message ID to MessageNode
+            root_id: ID of root message
+            
+        Returns:
+            Map with the single "main" branch
+        """
+        main: list[str] = []
+        node = nodes[root_id]
+        while True:
+            node.branch_id = "main"
+            node.is_active = True
+            main.append(node.id)
+            if not node.children:
+                break
+            node = node.children[0]
+        
+        return {"main": main}
+    
     def _find_active_branch(
         self,
         nodes: dict[str, MessageNode],
-        branches: dict[str, list[str]]
+        branches: dict[str, list[str]],
+        by_instant: bool = True
     ) -> str:
         """
         Determine which branch is "active".
@@ -264,21 +414,24 @@ class BranchDetector:
         Args:
             nodes: Map of message ID to MessageNode
             branches: Map of branch_id to list of message IDs
+            by_instant: Compare parsed instants; if False, compare the raw
+                timestamp strings (used when some timestamp is unparseable)
             
         Returns:
             ID of active branch
         """
-        latest_timestamp = None
+        latest_timestamp: Any = None
         active_branch = "main"
         
+        # Single scan over all labelled messages; the strict comparison keeps
+        # the earliest branch on ties, as a per-branch max() would
         for branch_id, message_ids in branches.items():
-            # Get timestamps for all messages in this branch
-            branch_timestamps = [nodes[mid].timestamp for mid in message_ids]
-            max_timestamp = max(branch_timestamps)
-            
-            if latest_timestamp is None or max_timestamp > latest_timestamp:
-                latest_timestamp = max_timestamp
-                active_branch = branch_id
+            for mid in message_ids:
+                node = nodes[mid]
+                timestamp = node.timestamp_ns if by_instant else node.timestamp
+                if latest_timestamp is None or timestamp > latest_timestamp:
+                    latest_timestamp = timestamp
+                    active_branch = branch_id
         
         # Mark nodes on active branch
         for msg_id in branches[active_branch]:
@@ -290,6 +443,10 @@ class BranchDetector:
         """
         Calculate quality metrics for tree structure.
         
+        The result is computed once per tree and cached on it, so repeated
+        calls are cheap. Each call returns its own copy, so callers may
+        modify the result.
+        
         Args:
             tree: ConversationTree to analyze
             
@@ -303,41 +460,100 @@ class BranchDetector:
             >>> metrics['total_messages'] > 0
             True
         """
+        if not tree._metrics_cache:
+            tree._metrics_cache = self._compute_metrics(tree)
+        
+        metrics = dict(tree._metrics_cache)
+        metrics["branch_distribution"] = dict(metrics["branch_distribution"])
+        return metrics
+    
+    def _compute_metrics(self, tree: ConversationTree) -> dict[str, Any]:
+        """Compute get_metrics' result for a tree."""
+        arrays = self.to_arrays(tree)
+        child_counts = tree.child_counts.values() or arrays.child_count
+        
         return {
             "total_messages": len(tree.nodes),
             "total_branches": len(tree.branches),
-            "branch_points": sum(
-                1 for node in tree.nodes.values() if len(node.children) > 1
-            ),
-            "max_depth": self._calculate_depth(tree),
+            "branch_points": sum(1 for count in child_counts if count > 1),
+            "max_depth": self._calculate_depth(arrays),
             "active_branch_length": len(tree.branches[tree.active_branch]),
             "branch_distribution": {
                 bid: len(mids) for bid, mids in tree.branches.items()
             }
         }
     
-    def _calculate_depth(self, tree: ConversationTree) -> int:
+    def to_arrays(self, tree: ConversationTree) -> TreeArrays:
+        """
+        Flatten a tree into parallel arrays indexed by node position.
+        
+        Args:
+            tree: ConversationTree to flatten
+            
+        Returns:
+            TreeArrays view of the tree
+            
+        Examples:
+            >>> arrays = detector.to_arrays(tree)
+            >>> arrays.ids[0] == tree.root_id
+            True
+        """
+        order: list[MessageNode] = []
+        stack = [tree.nodes[tree.root_id]]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(reversed(node.children))
+        
+        reachable = len(order)
+        if reachable < len(tree.nodes):
+            seen = {node.id for node in order}
+            order.extend(n for nid, n in tree.nodes.items() if nid not in seen)
+        
+        ids = [node.id for node in order]
+        index = {nid: i for i, nid in enumerate(ids)}
+        
+        return TreeArrays(
+            ids=ids,
+            index=index,
+            parent=array('q', (
+                index.get(node.parent_id, -1) if node.parent_id else -1
+                for node in order
+            )),
+            timestamp_ns=array('q', (node.timestamp_ns for node in order)),
+            child_count=array('q', (len(node.children) for node in order)),
+            reachable=reachable
+        )
+    
+    def _calculate_depth(self, arrays: TreeArrays) -> int:
         """
         Calculate maximum depth of conversation tree.
         
+        Relies on pre-order layout: a parent's depth is always known before
+        its children are visited, so one forward pass suffices.
+        
         Args:
-            tree: ConversationTree to analyze
+            arrays: TreeArrays view of the tree to analyze
             
         Returns:
             Maximum depth (number of levels from root to deepest leaf)
         """
-        def depth_recursive(node_id: str) -> int:
-            node = tree.nodes[node_id]
-            if not node.children:
-                return 1
-            return 1 + max(depth_recursive(child.id) for child in node.children)
+        parent = arrays.parent
+        depth = array('q', bytes(8 * arrays.reachable))
+        max_depth = 0
+        for i in range(arrays.reachable):
+            p = parent[i]
+            d = 1 if p < 0 else depth[p] + 1
+            depth[i] = d
+            if d > max_depth:
+                max_depth = d
         
-        return depth_recursive(tree.root_id)
+        return max_depth
 
 
 if __name__ == "__main__":
     # Quick test with sample conversation
-    sample_messages = [
+    sample_messages: list[dict[str, Any]] = [
         {
             "id": "msg_1",
             "parent_id": None,
@@ -7,6 +7,7 @@ Extract Claude conversations and generate structured reports.
 Usage:
     python scripts/extract.py https://claude.ai/chat/YOUR_CONV_ID
     python scripts/extract.py --from-file conversation.json
+    python scripts/extract.py --from-file a.json b.json c.json
     python scripts/extract.py URL --output-dir ./my_exports
 
 Examples:
@@ -21,18 +22,174 @@ Examples:
 """
 
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import json
+import os
 import sys
+import tempfile
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from nano_agents.url_parser import URLParser, ConversationIdentifier
 from nano_agents.api_fetcher import APIDataFetcher
-from nano_agents.branch_detector import BranchDetector
+from nano_agents.branch_detector import BranchDetector, ConversationTree, MessageNode
+
+
+# mkstemp creates files readable only by their owner; renamed-in outputs
+# get the permissions a plain open() would give instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Exports at least this large are streamed through APIDataFetcher.iter_messages
+# instead of being parsed into one document first
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def _encode_node(obj: object) -> dict:
+    """
+    JSON default hook exporting a MessageNode's public message fields.
+    
+    Children and internal fields (timestamp_ns) are left out; the tree
+    shape is already captured by parent_id and tree_structure.
+    """
+    if isinstance(obj, MessageNode):
+        return {
+            "id": obj.id,
+            "parent_id": obj.parent_id,
+            "role": obj.role,
+            "content": obj.content,
+            "timestamp": obj.timestamp,
+            "branch_id": obj.branch_id,
+            "is_active": obj.is_active,
+            "artifacts": obj.artifacts,
+            "tool_calls": obj.tool_calls
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: object) -> bytes:
+    """Encode one value as indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_encode_node,
+            # Route MessageNode dataclasses through _encode_node
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    return json.dumps(
+        obj, indent=2, ensure_ascii=False, default=_encode_node
+    ).encode('utf-8')
+
+
+def _write_output(output_path: Path, output_data: dict) -> None:
+    """
+    Stream output data to disk as indented UTF-8 JSON.
+    
+    Top-level values are encoded one at a time, and list values (the
+    messages) one item at a time, so peak memory is one message's
+    encoding rather than the whole document. The layout matches
+    json.dump(indent=2); encoded JSON has no raw newlines inside strings,
+    so nested blobs are re-indented by rewriting their newlines.
+    
+    The document is written to a temp file beside output_path and renamed
+    over it when complete, so a failed run never leaves a truncated file
+    or destroys earlier output.
+    
+    Blocking; callers on the event loop run it via asyncio.to_thread.
+    """
+    fd, name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}."
+    )
+    tmp = Path(name)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(output_data.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_dumps(key) + b': ')
+                if isinstance(value, list) and value:
+                    f.write(b'[')
+                    for j, item in enumerate(value):
+                        f.write(b',\n    ' if j else b'\n    ')
+                        f.write(_dumps(item).replace(b'\n', b'\n    '))
+                    f.write(b'\n  ]')
+                else:
+                    f.write(_dumps(value).replace(b'\n', b'\n  '))
+            f.write(b'\n}' if output_data else b'}')
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, output_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _output_data(
+    raw_data: dict,
+    conv_id: str,
+    tree: ConversationTree,
+    metrics: dict[str, Any],
+    extracted_at: str
+) -> dict:
+    """Assemble the output document for one conversation."""
+    return {
+        "conversation_id": conv_id,
+        "extracted_at": extracted_at,
+        "metadata": raw_data.get('metadata', {}),
+        "tree_structure": {
+            "root_id": tree.root_id,
+            "branches": tree.branches,
+            "active_branch": tree.active_branch
+        },
+        # Nodes are converted one at a time by _encode_node while writing
+        "messages": list(tree.nodes.values()),
+        "metrics": metrics
+    }
+
+
+def _extract_to_staging(
+    filepath: Path,
+    staging_path: Path,
+    extracted_at: str
+) -> tuple[str, dict[str, Any]]:
+    """
+    Load, build and write one exported conversation.
+    
+    Runs in a worker process, so only the conversation ID and metrics
+    travel back to the parent; the tree itself never leaves the worker.
+    
+    Args:
+        filepath: Path to exported JSON file
+        staging_path: Where to write the output document
+        extracted_at: Extraction run timestamp
+        
+    Returns:
+        Tuple of (conversation ID, tree metrics)
+    """
+    fetcher = APIDataFetcher()
+    detector = BranchDetector()
+    if filepath.exists() and filepath.stat().st_size >= STREAM_THRESHOLD_BYTES:
+        raw_data: dict = {}
+        tree = detector.build_tree(fetcher.iter_messages(filepath, raw_data))
+    else:
+        raw_data = asyncio.run(fetcher.fetch_from_file(filepath))
+        tree = detector.build_tree(raw_data['messages'])
+    metrics = detector.get_metrics(tree)
+    conv_id = raw_data.get('id', filepath.stem)
+    
+    _write_output(
+        staging_path,
+        _output_data(raw_data, conv_id, tree, metrics, extracted_at)
+    )
+    return conv_id, metrics
 
 
 class ConversationExtractor:
@@ -55,6 +212,9 @@ class ConversationExtractor:
         self.url_parser = URLParser()
         self.fetcher = APIDataFetcher()
         self.branch_detector = BranchDetector()
+        
+        # One timestamp per extraction run, shared by every output file
+        self.extracted_at = datetime.now().isoformat()
     
     async def extract_from_url(self, url: str) -> Path:
         """
@@ -111,6 +271,9 @@ class ConversationExtractor:
         Returns:
             Path to processed JSON file
         """
+        if filepath.exists() and filepath.stat().st_size >= STREAM_THRESHOLD_BYTES:
+            return await self._extract_streaming(filepath)
+        
         print(f"📂 Loading from file: {filepath}")
         
         try:
@@ -125,10 +288,113 @@ class ConversationExtractor:
         
         return await self._process_conversation_data(raw_data, conv_id)
     
+    async def _extract_streaming(self, filepath: Path) -> Path:
+        """
+        Extract a large exported file without parsing it into one document.
+        
+        Messages stream from APIDataFetcher.iter_messages straight into the
+        tree builder; the export's other top-level fields are collected on
+        the way.
+        
+        Args:
+            filepath: Path to exported JSON file
+            
+        Returns:
+            Path to processed JSON file
+        """
+        print(f"📂 Streaming from file: {filepath}")
+        print("\n🌳 Building conversation tree...")
+        
+        header: dict = {}
+        try:
+            # CPU-bound; run off the event loop
+            tree = await asyncio.to_thread(
+                self.branch_detector.build_tree,
+                self.fetcher.iter_messages(filepath, header)
+            )
+        except Exception as e:
+            print(f"✗ File loading failed: {e}")
+            sys.exit(1)
+        
+        conv_id = header.get('id', filepath.stem)
+        return await self._process_conversation_data(header, conv_id, tree)
+    
+    async def extract_from_files(
+        self,
+        filepaths: list[Path],
+        max_workers: Optional[int] = None
+    ) -> list[Path]:
+        """
+        Extract several manually exported conversations.
+        
+        Each file is loaded, built and written by its own worker process,
+        one conversation per task. Outputs are staged under temporary
+        names and only moved into place once every file has succeeded
+        and no two files share a conversation ID.
+        
+        Args:
+            filepaths: Paths to exported JSON files
+            max_workers: Worker process count (defaults to CPU count)
+            
+        Returns:
+            Paths to processed JSON files, in input order
+        """
+        print(f"📂 Extracting {len(filepaths)} files...")
+        
+        staging_paths = [
+            self.output_dir / f".extract.{os.getpid()}.{i}.partial"
+            for i in range(len(filepaths))
+        ]
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        executor, _extract_to_staging,
+                        filepath, staging_path, self.extracted_at
+                    )
+                    for filepath, staging_path in zip(filepaths, staging_paths)
+                ))
+        except Exception as e:
+            for staging_path in staging_paths:
+                staging_path.unlink(missing_ok=True)
+            print(f"✗ Extraction failed: {e}")
+            sys.exit(1)
+        
+        # Two files with the same ID would overwrite each other's output
+        sources: dict[str, list[Path]] = {}
+        for filepath, (conv_id, _) in zip(filepaths, results):
+            sources.setdefault(conv_id, []).append(filepath)
+        duplicates = {
+            conv_id: paths for conv_id, paths in sources.items()
+            if len(paths) > 1
+        }
+        if duplicates:
+            for staging_path in staging_paths:
+                staging_path.unlink(missing_ok=True)
+            print("✗ Duplicate conversation IDs:")
+            for conv_id, paths in duplicates.items():
+                print(f"  {conv_id}: {', '.join(str(path) for path in paths)}")
+            sys.exit(1)
+        
+        output_paths = []
+        for filepath, staging_path, (conv_id, metrics) in zip(
+            filepaths, staging_paths, results
+        ):
+            output_path = self.output_dir / f"conv_{conv_id}.json"
+            os.replace(staging_path, output_path)
+            output_paths.append(output_path)
+            print(
+                f"✓ {filepath.name}: {metrics['total_messages']} messages, "
+                f"{metrics['total_branches']} branches -> {output_path}"
+            )
+        return output_paths
+    
     async def _process_conversation_data(
         self,
         raw_data: dict,
-        conv_id: str
+        conv_id: str,
+        tree: Optional[ConversationTree] = None
     ) -> Path:
         """
         Process conversation data through all agents.
@@ -136,14 +402,20 @@ class ConversationExtractor:
         Args:
             raw_data: Raw conversation data
             conv_id: Conversation ID
+            tree: Conversation tree already built from raw_data's messages
+                (built here from raw_data['messages'] if None)
             
         Returns:
             Path to final output file
         """
         # Step 3: Build conversation tree
-        print(f"\n🌳 Building conversation tree...")
         try:
-            tree = self.branch_detector.build_tree(raw_data['messages'])
+            if tree is None:
+                print("\n🌳 Building conversation tree...")
+                # CPU-bound; run off the event loop
+                tree = await asyncio.to_thread(
+                    self.branch_detector.build_tree, raw_data['messages']
+                )
             metrics = self.branch_detector.get_metrics(tree)
             
             print(f"✓ Tree built successfully")
@@ -158,39 +430,13 @@ class ConversationExtractor:
         
         # Step 4: Generate output
         print(f"\n💾 Generating output...")
-        output_data = {
-            "conversation_id": conv_id,
-            "extracted_at": datetime.now().isoformat(),
-            "metadata": raw_data.get('metadata', {}),
-            "tree_structure": {
-                "root_id": tree.root_id,
-                "branches": {
-                    bid: [nodes for nodes in message_ids]
-                    for bid, message_ids in tree.branches.items()
-                },
-                "active_branch": tree.active_branch
-            },
-            "messages": [
-                {
-                    "id": node.id,
-                    "parent_id": node.parent_id,
-                    "role": node.role,
-                    "content": node.content,
-                    "timestamp": node.timestamp,
-                    "branch_id": node.branch_id,
-                    "is_active": node.is_active,
-                    "artifacts": node.artifacts,
-                    "tool_calls": node.tool_calls
-                }
-                for node in tree.nodes.values()
-            ],
-            "metrics": metrics
-        }
+        output_data = _output_data(
+            raw_data, conv_id, tree, metrics, self.extracted_at
+        )
         
         # Save to file
         output_path = self.output_dir / f"conv_{conv_id}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(_write_output, output_path, output_data)
         
         print(f"✓ Saved to: {output_path}")
         
@@ -227,6 +473,9 @@ Examples:
   # Process manually exported file
   %(prog)s --from-file conversation.json
   
+  # Process several files, building trees in parallel
+  %(prog)s --from-file a.json b.json c.json --workers 4
+  
   # Custom output directory
   %(prog)s URL --output-dir ./my_exports
         """
@@ -240,7 +489,14 @@ Examples:
     parser.add_argument(
         '--from-file',
         type=Path,
-        help='Path to manually exported JSON file'
+        nargs='+',
+        help='Path(s) to manually exported JSON file(s)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for multi-file extraction (default: CPU count)'
     )
     parser.add_argument(
         '--output-dir',
@@ -268,14 +524,20 @@ Examples:
     
     # Run extraction
     try:
-        if args.from_file:
-            result = asyncio.run(extractor.extract_from_file(args.from_file))
+        if args.from_file and len(args.from_file) > 1:
+            results = asyncio.run(
+                extractor.extract_from_files(args.from_file, args.workers)
+            )
+        elif args.from_file:
+            results = [asyncio.run(extractor.extract_from_file(args.from_file[0]))]
         else:
-            result = asyncio.run(extractor.extract_from_url(args.url))
+            results = [asyncio.run(extractor.extract_from_url(args.url))]
         
-        if result and result.exists():
+        results = [result for result in results if result and result.exists()]
+        if results:
             print(f"\n✨ Extraction complete! View your data at:")
-            print(f"   {result}")
+            for result in results:
+                print(f"   {result}")
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Extraction cancelled by user")
@@ -2,6 +2,7 @@
 Setup configuration for claude-conversation-extractor
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -15,6 +16,20 @@ requirements = []
 if requirements_path.exists():
     requirements = requirements_path.read_text().strip().split("\n")
 
+# Optionally compile hot, pure-Python modules to C extensions with mypyc.
+# Enable with CONVERSATION_ARCHAEOLOGIST_MYPYC=1 (requires mypy[mypyc]);
+# the plain Python modules are used otherwise. The [tool.mypy] settings in
+# pyproject.toml apply; --explicit-package-bases names modules from this
+# directory even though the checkout root has an __init__.py.
+ext_modules = []
+if os.environ.get("CONVERSATION_ARCHAEOLOGIST_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "--explicit-package-bases",
+        "nano_agents/branch_detector.py",
+    ])
+
 setup(
     name="claude-conversation-extractor",
     version="0.1.0",
@@ -29,7 +44,9 @@ setup(
         "Source": "https://github.com/yourusername/claude-conversation-extractor",
         "Documentation": "https://github.com/yourusername/claude-conversation-extractor/docs",
     },
-    package_dir={"": "src"},
+    # nano_agents sits at the top level, outside src/; mapped so that
+    # build_ext --inplace puts compiled modules next to their sources
+    package_dir={"": "src", "nano_agents": "nano_agents"},
     packages=find_packages(where="src"),
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -64,6 +81,7 @@ setup(
             "claude-extractor=claude_extractor.cli:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     zip_safe=False,
     keywords="claude ai conversation export extract anthropic",
@@ -50,6 +50,36 @@ class TestAPIDataFetcher:
         finally:
             temp_path.unlink()
 
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_stdlib_fallback(self, monkeypatch):
+        """Test loading still works when orjson is unavailable."""
+        from nano_agents import api_fetcher
+        monkeypatch.setattr(api_fetcher, "orjson", None)
+
+        test_data = {
+            "id": "test-conv-id",
+            "messages": [
+                {
+                    "id": "msg_1",
+                    "parent_id": None,
+                    "role": "user",
+                    "content": "Héllo ✓",
+                    "timestamp": "2024-01-01T10:00:00Z"
+                }
+            ]
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False,
+                                         encoding='utf-8') as f:
+            json.dump(test_data, f, ensure_ascii=False)
+            temp_path = Path(f.name)
+
+        try:
+            result = await self.fetcher.fetch_from_file(temp_path)
+            assert result["messages"][0]["content"] == "Héllo ✓"
+        finally:
+            temp_path.unlink()
+
     @pytest.mark.asyncio
     async def test_fetch_from_file_not_found(self):
         """Test that missing file raises error."""
@@ -71,6 +101,18 @@ class TestAPIDataFetcher:
         finally:
             temp_path.unlink()
 
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_empty_file(self):
+        """Test that an empty file is reported as invalid JSON."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = Path(f.name)
+
+        try:
+            with pytest.raises(ValueError, match="Invalid JSON"):
+                await self.fetcher.fetch_from_file(temp_path)
+        finally:
+            temp_path.unlink()
+
     @pytest.mark.asyncio
     async def test_fetch_from_file_missing_messages(self):
         """Test that data without messages field is rejected."""
@@ -86,6 +128,120 @@ class TestAPIDataFetcher:
         finally:
             temp_path.unlink()
 
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_concurrent(self):
+        """Test that several files can be loaded concurrently."""
+        paths = []
+        for i in range(3):
+            test_data = {
+                "id": f"conv-{i}",
+                "messages": [
+                    {"id": "msg_1", "parent_id": None, "role": "user",
+                     "content": f"Message {i}", "timestamp": "2024-01-01T10:00:00Z"}
+                ]
+            }
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                json.dump(test_data, f)
+                paths.append(Path(f.name))
+
+        try:
+            results = await asyncio.gather(
+                *(self.fetcher.fetch_from_file(p) for p in paths)
+            )
+
+            assert [r["id"] for r in results] == ["conv-0", "conv-1", "conv-2"]
+            assert self.fetcher.strategy_successes[FetchStrategy.MANUAL] == 3
+        finally:
+            for p in paths:
+                p.unlink()
+
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_cached_until_modified(self):
+        """Test that unchanged files are served from the cache."""
+        import os
+
+        test_data = {
+            "id": "v1",
+            "messages": [
+                {"id": "msg_1", "parent_id": None, "role": "user",
+                 "content": "Test", "timestamp": "2024-01-01T10:00:00Z"}
+            ]
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(test_data, f)
+            temp_path = Path(f.name)
+
+        try:
+            first = await self.fetcher.fetch_from_file(temp_path)
+            load_sync = self.fetcher._load_sync
+            self.fetcher._load_sync = None  # A cache miss would fail here
+            second = await self.fetcher.fetch_from_file(temp_path)
+            self.fetcher._load_sync = load_sync
+            assert second == first
+
+            # Rewrite with a different size and a newer mtime
+            test_data["id"] = "v2-modified"
+            temp_path.write_text(json.dumps(test_data))
+            stat = temp_path.stat()
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            third = await self.fetcher.fetch_from_file(temp_path)
+            assert third["id"] == "v2-modified"
+        finally:
+            temp_path.unlink()
+
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_cache_isolated_from_mutation(self):
+        """Test that mutating a fetched result doesn't change later fetches."""
+        test_data = {
+            "id": "conv",
+            "metadata": {"title": "Original"},
+            "messages": [
+                {"id": "msg_1", "parent_id": None, "role": "user",
+                 "content": "Test", "timestamp": "2024-01-01T10:00:00Z"}
+            ]
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(test_data, f)
+            temp_path = Path(f.name)
+
+        try:
+            first = await self.fetcher.fetch_from_file(temp_path)
+            first["id"] = "changed"
+            first["metadata"]["title"] = "Changed"
+            first["messages"][0]["content"] = "Changed"
+            first["messages"].append({"id": "msg_2"})
+
+            second = await self.fetcher.fetch_from_file(temp_path)
+            second["messages"].clear()
+
+            third = await self.fetcher.fetch_from_file(temp_path)
+            assert third == test_data
+        finally:
+            temp_path.unlink()
+
+    @pytest.mark.asyncio
+    async def test_fetch_from_file_cache_bounded(self):
+        """Test that the cache evicts least recently used files."""
+        fetcher = APIDataFetcher(cache_size=1)
+        paths = []
+        for i in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                json.dump({"messages": [{"id": str(i)}]}, f)
+                paths.append(Path(f.name))
+
+        try:
+            for p in paths:
+                await fetcher.fetch_from_file(p)
+
+            assert len(fetcher._load_cache) == 1
+            assert next(iter(fetcher._load_cache))[0] == str(paths[1])
+        finally:
+            for p in paths:
+                p.unlink()
+
     @pytest.mark.asyncio
     async def test_fetch_prompts_manual_export(self):
         """Test that fetch() prompts for manual export in Phase 1."""
@@ -118,6 +274,78 @@ class TestAPIDataFetcher:
         assert manual_stats["attempts"] == 1
 
 
+class TestAPIDataFetcherStreaming:
+    """Test streaming message reader."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fetcher = APIDataFetcher()
+
+    def test_iter_messages_feeds_build_tree(self):
+        """Test that streamed messages build the same tree as a full load."""
+        from nano_agents.branch_detector import BranchDetector
+
+        test_data = {
+            "id": "test-conv-id",
+            "messages": [
+                {"id": "1", "parent_id": None, "role": "user",
+                 "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+                {"id": "2", "parent_id": "1", "role": "assistant",
+                 "content": "A", "timestamp": "2024-01-01T10:00:01Z"},
+            ]
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(test_data, f)
+            temp_path = Path(f.name)
+
+        try:
+            tree = BranchDetector().build_tree(self.fetcher.iter_messages(temp_path))
+
+            assert tree.root_id == "1"
+            assert len(tree.nodes) == 2
+            assert self.fetcher.strategy_successes[FetchStrategy.MANUAL] == 1
+        finally:
+            temp_path.unlink()
+
+    def test_iter_messages_empty_list(self):
+        """Test that an export with no messages is rejected."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"messages": []}, f)
+            temp_path = Path(f.name)
+
+        try:
+            with pytest.raises(ValueError, match="'messages' list is empty"):
+                list(self.fetcher.iter_messages(temp_path))
+        finally:
+            temp_path.unlink()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data, match", [
+        ({"id": "x"}, "missing 'messages' field"),
+        ({"messages": "not a list"}, "'messages' must be a list"),
+        ({"messages": {"item": {"id": "1"}}}, "'messages' must be a list"),
+    ])
+    async def test_iter_messages_invalid_structure(self, data, match):
+        """Test that structure errors match fetch_from_file's."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = Path(f.name)
+
+        try:
+            with pytest.raises(ValueError, match=match):
+                list(self.fetcher.iter_messages(temp_path))
+            with pytest.raises(ValueError, match=match):
+                await self.fetcher.fetch_from_file(temp_path)
+        finally:
+            temp_path.unlink()
+
+    def test_iter_messages_not_found(self):
+        """Test that missing file raises error."""
+        with pytest.raises(FileNotFoundError, match="Manual export file not found"):
+            list(self.fetcher.iter_messages(Path("/tmp/nonexistent-file-12345.json")))
+
+
 class TestAPIDataFetcherValidation:
     """Test data validation logic."""
 
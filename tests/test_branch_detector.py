@@ -4,6 +4,8 @@ Unit tests for Branch Detector nano-agent.
 Run with: pytest tests/test_branch_detector.py -v
 """
 
+import sys
+
 import pytest
 from nano_agents.branch_detector import BranchDetector, MessageNode, ConversationTree
 
@@ -116,7 +118,69 @@ class TestBranchDetector:
         assert metrics['total_branches'] == 2
         assert metrics['branch_points'] == 1  # One node with multiple children
         assert metrics['max_depth'] == 2
+        assert tree.child_counts == {"1": 2}
     
+    def test_repeated_strings_are_shared(self):
+        """Test that role and branch labels are interned across nodes."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "".join(["us", "er"]),
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "".join(["assis", "tant"]),
+             "content": "A1", "timestamp": "2024-01-01T10:00:01Z"},
+            {"id": "3", "parent_id": "1", "role": "".join(["assis", "tant"]),
+             "content": "A2", "timestamp": "2024-01-01T10:00:02Z"},
+            {"id": "4", "parent_id": "3", "role": "".join(["us", "er"]),
+             "content": "Q2", "timestamp": "2024-01-01T10:00:03Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.nodes["1"].role is tree.nodes["4"].role
+        assert tree.nodes["2"].role is tree.nodes["3"].role
+        assert tree.nodes["3"].branch_id is tree.nodes["4"].branch_id
+
+    def test_to_arrays_layout(self):
+        """Test struct-of-arrays view of the tree."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "3", "parent_id": "1", "role": "assistant",
+             "content": "A2", "timestamp": "2024-01-01T10:00:02Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "2024-01-01T10:00:01Z"},
+            {"id": "orphan", "parent_id": "missing", "role": "user",
+             "content": "?", "timestamp": "2024-01-01T10:00:03Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+        arrays = self.detector.to_arrays(tree)
+
+        assert arrays.ids == ["1", "3", "2", "orphan"]
+        assert arrays.reachable == 3
+        assert list(arrays.parent) == [-1, 0, 0, -1]
+        assert list(arrays.child_count) == [2, 0, 0, 0]
+        assert arrays.timestamp_ns[arrays.index["2"]] == tree.nodes["2"].timestamp_ns
+
+    def test_metrics_are_cached(self):
+        """Test that cached metrics are returned as independent copies."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A", "timestamp": "2024-01-01T10:00:01Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+        first = self.detector.get_metrics(tree)
+        first['extra'] = True
+        first['branch_distribution']['main'] = 0
+
+        second = self.detector.get_metrics(tree)
+        assert second is not first
+        assert 'extra' not in second
+        assert second['branch_distribution'] == {'main': 2}
+        assert second['total_messages'] == 2
+
     def test_empty_message_list(self):
         """Test that empty message list is rejected."""
         with pytest.raises(ValueError, match="empty message list"):
@@ -146,6 +210,16 @@ class TestBranchDetector:
         with pytest.raises(ValueError, match="Invalid role"):
             self.detector.build_tree(invalid_messages)
     
+    def test_unhashable_role(self):
+        """Test that non-string roles are rejected as invalid."""
+        invalid_messages = [
+            {"id": "1", "parent_id": None, "role": ["user"],
+             "content": "Test", "timestamp": "2024-01-01T10:00:00Z"}
+        ]
+
+        with pytest.raises(ValueError, match="Invalid role"):
+            self.detector.build_tree(invalid_messages)
+
     def test_multiple_roots(self):
         """Test that multiple root messages are rejected."""
         invalid_messages = [
@@ -158,6 +232,36 @@ class TestBranchDetector:
         with pytest.raises(ValueError, match="Multiple root messages"):
             self.detector.build_tree(invalid_messages)
     
+    def test_missing_artifacts_share_empty_default(self):
+        """Test that absent artifacts/tool_calls don't allocate new lists."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A", "timestamp": "2024-01-01T10:00:01Z",
+             "artifacts": [{"type": "code"}]},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.nodes["1"].artifacts == ()
+        assert tree.nodes["1"].tool_calls is tree.nodes["2"].tool_calls
+        assert tree.nodes["2"].artifacts == [{"type": "code"}]
+
+    def test_duplicate_message_ids(self):
+        """Test that repeated message IDs are rejected."""
+        invalid_messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q1", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "2024-01-01T10:00:01Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1 again", "timestamp": "2024-01-01T10:00:02Z"},
+        ]
+
+        with pytest.raises(ValueError, match="Duplicate message id: 2"):
+            self.detector.build_tree(invalid_messages)
+
     def test_message_node_properties(self):
         """Test MessageNode dataclass properties."""
         node = MessageNode(
@@ -177,6 +281,19 @@ class TestBranchDetector:
         assert len(node.tool_calls) == 1
         assert node.branch_id == "main"  # Default
         assert not node.is_active  # Default
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_message_node_uses_slots(self):
+        """Test that MessageNode instances carry no per-instance __dict__."""
+        node = MessageNode(
+            id="test_id",
+            parent_id=None,
+            role="user",
+            content="Test content",
+            timestamp="2024-01-01T10:00:00Z"
+        )
+
+        assert not hasattr(node, "__dict__")
     
     def test_active_branch_selection(self):
         """Test that most recent branch is marked as active."""
@@ -195,6 +312,70 @@ class TestBranchDetector:
         assert tree.nodes["3"].is_active
         assert not tree.nodes["2"].is_active
 
+    def test_active_branch_compares_instants(self):
+        """Test that timestamps with different offsets compare by instant."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            # 10:30 UTC - lexically larger but earlier in time
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "2024-01-01T12:30:00+02:00"},
+            {"id": "3", "parent_id": "1", "role": "assistant",
+             "content": "A2", "timestamp": "2024-01-01T11:00:00Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.active_branch == "branch_1"
+        assert tree.nodes["3"].timestamp_ns > tree.nodes["2"].timestamp_ns
+
+    def test_invalid_timestamp_falls_back_to_string_order(self):
+        """Test that unparseable timestamps are compared as strings."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "day 1"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "day 3"},
+            {"id": "3", "parent_id": "1", "role": "assistant",
+             "content": "A2", "timestamp": "day 2"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.nodes["1"].timestamp_ns == 0
+        assert tree.active_branch == tree.nodes["2"].branch_id
+        assert tree.nodes["2"].is_active
+        assert not tree.nodes["3"].is_active
+
+    def test_seven_digit_fraction_timestamp(self):
+        """Test that fractions longer than microseconds are truncated."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "2024-01-01T10:00:01.9000000+01:00"},
+            {"id": "3", "parent_id": "1", "role": "assistant",
+             "content": "A2", "timestamp": "2024-01-01T10:00:01.1234567Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.nodes["3"].timestamp_ns == (
+            1704103201 * 1_000_000_000 + 123_456_000
+        )
+        assert tree.active_branch == tree.nodes["3"].branch_id
+
+    def test_z_suffix_timestamp(self):
+        """Test that a 'Z' suffix is read as UTC."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T00:00:00Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        assert tree.nodes["1"].timestamp_ns == 1704067200 * 1_000_000_000
+
 
 class TestBranchDetectorComplexCases:
     """Test complex branching scenarios."""
@@ -251,6 +432,51 @@ class TestBranchDetectorComplexCases:
         # msg_9 should have two children: msg_10 and msg_11
         assert len(tree.nodes["msg_9"].children) == 2
 
+    def test_very_long_conversation(self):
+        """Test that deep trees don't hit the recursion limit."""
+        messages = [
+            {
+                "id": f"msg_{i}",
+                "parent_id": f"msg_{i-1}" if i > 0 else None,
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i}",
+                "timestamp": "2024-01-01T10:00:00Z"
+            }
+            for i in range(5000)
+        ]
+
+        tree = self.detector.build_tree(messages)
+        metrics = self.detector.get_metrics(tree)
+
+        assert len(tree.branches["main"]) == 5000
+        assert metrics['max_depth'] == 5000
+        assert tree.active_branch == "main"
+        assert all(node.is_active for node in tree.nodes.values())
+
+    def test_nested_branch_numbering(self):
+        """Test that branches are numbered in depth-first order."""
+        messages = [
+            {"id": "1", "parent_id": None, "role": "user",
+             "content": "Q", "timestamp": "2024-01-01T10:00:00Z"},
+            {"id": "2", "parent_id": "1", "role": "assistant",
+             "content": "A1", "timestamp": "2024-01-01T10:00:01Z"},
+            {"id": "3", "parent_id": "1", "role": "assistant",
+             "content": "A2", "timestamp": "2024-01-01T10:00:02Z"},
+            {"id": "4", "parent_id": "2", "role": "user",
+             "content": "Q2a", "timestamp": "2024-01-01T10:00:03Z"},
+            {"id": "5", "parent_id": "2", "role": "user",
+             "content": "Q2b", "timestamp": "2024-01-01T10:00:04Z"},
+        ]
+
+        tree = self.detector.build_tree(messages)
+
+        # The nested branch under msg 2 is found before msg 1's second child
+        assert tree.branches == {
+            "main": ["1", "2", "4"],
+            "branch_1": ["5"],
+            "branch_2": ["3"],
+        }
+
 
 if __name__ == "__main__":
     # Run tests with pytest
@@ -0,0 +1,53 @@
+"""
+Build test for the optional mypyc-compiled Branch Detector.
+
+Run with: pytest tests/test_mypyc_build.py -v
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mypyc.build")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+COMPILER = (sysconfig.get_config_var("CC") or "cc").split()[0]
+
+
+@pytest.mark.skipif(shutil.which(COMPILER) is None, reason="no C compiler available")
+class TestMypycBuild:
+    """Test the CONVERSATION_ARCHAEOLOGIST_MYPYC=1 build."""
+
+    def test_build_ext_compiles_branch_detector(self, tmp_path):
+        """Test that the build passes the strict mypy config and runs."""
+        # Build from a copy so generated C and caches stay out of the tree
+        for name in ("setup.py", "pyproject.toml", "requirements.txt"):
+            shutil.copy(REPO_ROOT / name, tmp_path / name)
+        shutil.copytree(
+            REPO_ROOT / "nano_agents", tmp_path / "nano_agents",
+            ignore=shutil.ignore_patterns("__pycache__", "*.so")
+        )
+        env = dict(os.environ, CONVERSATION_ARCHAEOLOGIST_MYPYC="1")
+
+        build = subprocess.run(
+            [sys.executable, "setup.py", "build_ext", "--inplace"],
+            cwd=tmp_path, env=env, capture_output=True, text=True
+        )
+
+        assert build.returncode == 0, build.stdout + build.stderr
+        check = subprocess.run(
+            [sys.executable, "-c",
+             "import nano_agents.branch_detector as bd\n"
+             "assert not bd.__file__.endswith('.py'), bd.__file__\n"
+             "tree = bd.BranchDetector().build_tree([{'id': '1', "
+             "'parent_id': None, 'role': 'user', 'content': 'Hi', "
+             "'timestamp': '2024-01-01T10:00:00Z'}])\n"
+             "assert tree.root_id == '1'"],
+            cwd=tmp_path, capture_output=True, text=True
+        )
+        assert check.returncode == 0, check.stdout + check.stderr